@@ -65,14 +65,14 @@ from utils.cache import (
 )
 from utils.database import (
     init_database,
-    store_daily_snapshot,
+    store_daily_snapshots_bulk,
     get_history,
     get_data_quality_stats,
     get_country_trend_data
 )
 from utils.api_clients import (
-    SerpApiClient,
-    ExchangeRateClient,
+    get_serpapi_client,
+    get_exchange_client,
     get_col_for_country,
     load_countries,
     get_baseline_data,
@@ -183,8 +183,8 @@ def get_data_status() -> str:
     """Determine current data status."""
     if USE_MOCK_DATA:
         return "mock"
-    serpapi = SerpApiClient()
-    exchange_client = ExchangeRateClient()
+    serpapi = get_serpapi_client()
+    exchange_client = get_exchange_client()
     if serpapi.is_configured and exchange_client.is_configured:
         cache_age = get_cache_age("exchange")
         if cache_age:
@@ -205,8 +205,8 @@ def get_current_data(countries: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
     Returns:
         Dictionary mapping country_key to current data with quality info
     """
-    serpapi = SerpApiClient()
-    exchange_client = ExchangeRateClient()
+    serpapi = get_serpapi_client()
+    exchange_client = get_exchange_client()
 
     use_live_apis = not USE_MOCK_DATA and serpapi.is_configured and exchange_client.is_configured
 
@@ -220,26 +220,60 @@ def get_current_data(countries: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
     exchange_source = DataSource.BASELINE
 
     if use_live_apis:
-        # Try cache first with stale fallback
+        # Only the destination currencies read below are validated and cached
+        needed_currencies = {
+            country_info.get("currency_code", "USD")
+            for country_info in countries.get("destinations", {}).values()
+        }
+
+        # Try cache first with stale fallback. The cache records which
+        # currencies it was built for, so a cache from a smaller destination
+        # set counts as a miss instead of silently lacking rates.
         cached_exchange, cache_source = fetch_cached_data("exchange", allow_stale=True)
-        if cached_exchange:
+        if cached_exchange and needed_currencies <= set(
+            cached_exchange.get("currencies", cached_exchange.get("rates", ()))
+        ):
             exchange_rates = cached_exchange
             exchange_source = cache_source
             metrics.record_cache_hit()
         else:
             # Try live API
-            api_rates = exchange_client.get_rates(DISPLAY_CURRENCY)
+            api_rates = exchange_client.get_rates(DISPLAY_CURRENCY, needed=needed_currencies)
             if api_rates:
-                # Extract raw values for caching
+                # All rates share one fetch, so any wrapper carries the source
+                exchange_source = next(iter(api_rates.values())).source
                 raw_rates = {k: v.value for k, v in api_rates.items()}
-                save_cache("exchange", {"rates": raw_rates})
+                # Only fresh API rates go to the file cache; stale in-memory
+                # rates must not be re-stamped as fresh
+                if exchange_source is DataSource.LIVE_API:
+                    save_cache("exchange", {
+                        "rates": raw_rates,
+                        "currencies": sorted(needed_currencies),
+                    })
                 exchange_rates = {"rates": raw_rates}
-                exchange_source = DataSource.LIVE_API
                 metrics.record_cache_miss()
+            elif cached_exchange:
+                # Partial cached rates beat baseline for every destination
+                exchange_rates = cached_exchange
+                exchange_source = cache_source
 
     current_data = {}
     destinations = countries.get("destinations", {})
 
+    # Read flight caches up front and fetch all misses concurrently
+    cached_flights = {}
+    live_flights = {}
+    if use_live_apis and not USE_MOCK_DATA:
+        cached_flights = {
+            country_key: fetch_cached_data("flights", country_key, allow_stale=True)
+            for country_key in destinations
+        }
+        live_flights = serpapi.get_flight_prices_bulk([
+            (ORIGIN_AIRPORT, country_info.get("airport_code", ""))
+            for country_key, country_info in destinations.items()
+            if not cached_flights[country_key][0]
+        ])
+
     for country_key, country_info in destinations.items():
         currency_code = country_info.get("currency_code", "USD")
         airport_code = country_info.get("airport_code", "")
@@ -298,13 +332,13 @@ def get_current_data(countries: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
 
         if use_live_apis and not USE_MOCK_DATA:
             # Try cache first with stale fallback
-            cached_flight, cache_src = fetch_cached_data("flights", country_key, allow_stale=True)
+            cached_flight, cache_src = cached_flights[country_key]
             if cached_flight:
                 current_flight = cached_flight.get("price")
                 flight_source = cache_src
             else:
-                # Try live API
-                flight_result = serpapi.get_flight_price(ORIGIN_AIRPORT, airport_code)
+                # Live API result from the bulk fetch above
+                flight_result = live_flights.get((ORIGIN_AIRPORT, airport_code))
                 if flight_result:
                     current_flight = flight_result.value
                     flight_source = DataSource.LIVE_API
@@ -435,6 +469,7 @@ def calculate_rankings(countries: Dict[str, Any], current_data: Dict[str, Dict[s
         DataFrame with ranking data
     """
     rankings = []
+    snapshots = []
     destinations = countries.get("destinations", {})
 
     for country_key, country_info in destinations.items():
@@ -473,14 +508,14 @@ def calculate_rankings(countries: Dict[str, Any], current_data: Dict[str, Dict[s
         if quality:
             provenance = ProvenanceMetadata.from_destination_quality(quality)
 
-        # Store snapshot with provenance
-        store_daily_snapshot(
-            country_key,
-            country_info.get("name", ""),
-            score_data,
-            badges,
-            provenance=provenance
-        )
+        # Queue snapshot with provenance; written in one batch below
+        snapshots.append({
+            "country_key": country_key,
+            "country_name": country_info.get("name", ""),
+            "score_data": score_data,
+            "badges": badges,
+            "provenance": provenance,
+        })
 
         # Calculate quality score for display
         quality_score = quality.overall_quality_score if quality else 50
@@ -512,6 +547,8 @@ def calculate_rankings(countries: Dict[str, Any], current_data: Dict[str, Dict[s
             "access_data": current.get("access_data", {}),
         })
 
+    store_daily_snapshots_bulk(snapshots)
+
     # Sort by score descending
     rankings.sort(key=lambda x: x["Score"], reverse=True)
 
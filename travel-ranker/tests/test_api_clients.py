@@ -0,0 +1,493 @@
+"""
+Unit tests for API client helpers.
+Tests client-side rate limiting and 429 backoff handling.
+"""
+
+import json
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+from utils import api_clients, circuit_breaker
+from utils.api_clients import (
+    ExchangeRateClient,
+    RateLimitHandler,
+    SerpApiClient,
+    _load_json,
+    _parse_retry_after,
+    clear_data_caches,
+    get_col_for_country,
+)
+from utils.circuit_breaker import CircuitBreakerConfig, SimpleCircuitBreaker
+from utils.data_quality import DataSource
+
+
+class FakeClock:
+    """Monotonic clock that only advances when something sleeps."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Drive api_clients and circuit_breaker timing from one fake clock."""
+    clock = FakeClock()
+    monkeypatch.setattr(api_clients.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(api_clients.time, "sleep", clock.sleep)
+    monkeypatch.setattr(circuit_breaker, "_now", clock.monotonic)
+    return clock
+
+
+@pytest.fixture
+def recorded_sleeps(monkeypatch):
+    """Record time.sleep calls in api_clients instead of sleeping."""
+    sleeps = []
+    monkeypatch.setattr(api_clients.time, "sleep", sleeps.append)
+    return sleeps
+
+
+class TestRateLimitHandler:
+    """Tests for token bucket pacing and backoff."""
+
+    def test_default_has_no_client_side_cap(self, recorded_sleeps):
+        """Without a capacity, a burst of any size proceeds without waiting."""
+        handler = RateLimitHandler("test")
+        assert all(handler.check_rate_limit() for _ in range(100))
+        assert recorded_sleeps == []
+
+    def test_burst_beyond_capacity_waits_for_tokens(self, recorded_sleeps):
+        """Calls past the bucket size wait for their token instead of failing."""
+        handler = RateLimitHandler("test", capacity=3, refill_rate=10.0)
+        results = [handler.check_rate_limit() for _ in range(8)]
+
+        assert results == [True] * 8
+        # First three spend the burst, the remaining five each wait
+        assert len(recorded_sleeps) == 5
+        assert recorded_sleeps == sorted(recorded_sleeps)
+        assert recorded_sleeps[-1] == pytest.approx(0.5, abs=0.05)
+
+    def test_wait_longer_than_limit_is_refused(self, recorded_sleeps):
+        """A token further out than MAX_TOKEN_WAIT_SECONDS is not reserved."""
+        handler = RateLimitHandler("test", capacity=1, refill_rate=0.01)
+        assert handler.check_rate_limit() is True
+        assert handler.check_rate_limit() is False
+        assert recorded_sleeps == []
+
+    def test_clients_are_paced_by_default(self):
+        client = SerpApiClient()
+        config = client.circuit_breaker.config
+        assert client.rate_limiter._capacity == config.rate_limit_threshold / 2
+        assert client.rate_limiter._refill_rate == pytest.approx(
+            config.rate_limit_threshold / 2 / config.rate_limit_window
+        )
+        client.close()
+
+    def test_bucket_stays_inside_breaker_window(self, fake_clock):
+        """Every request the bucket lets through is also admitted by the breaker."""
+        config = CircuitBreakerConfig(rate_limit_threshold=10, rate_limit_window=60.0)
+        breaker = SimpleCircuitBreaker("test", config)
+        handler = RateLimitHandler.for_circuit_breaker("test", breaker)
+
+        admitted = []
+        for _ in range(30):
+            assert handler.check_rate_limit() is True
+            assert breaker.can_execute() is True
+            admitted.append(fake_clock.now)
+
+        for start in admitted:
+            in_window = [t for t in admitted if start <= t < start + 60.0]
+            assert len(in_window) <= 10
+
+    def test_available_requests_without_bucket(self):
+        assert RateLimitHandler("test").available_requests() is None
+
+    def test_available_requests_counts_refill_within_wait_limit(self, recorded_sleeps):
+        handler = RateLimitHandler("test", capacity=5, refill_rate=0.1)
+        # 5 in the bucket plus 0.1/s over MAX_TOKEN_WAIT_SECONDS
+        assert handler.available_requests() == 8
+
+        for _ in range(8):
+            assert handler.check_rate_limit() is True
+        assert handler.available_requests() == 0
+        assert handler.check_rate_limit() is False
+
+    def test_available_requests_zero_during_backoff(self):
+        handler = RateLimitHandler("test", capacity=5)
+        handler.handle_429(retry_after=60)
+        assert handler.available_requests() == 0
+
+    def test_backoff_blocks_requests(self):
+        """An active 429 backoff refuses requests even without a bucket."""
+        handler = RateLimitHandler("test")
+        handler.backoff_until = time.monotonic() + 60
+        assert handler.check_rate_limit() is False
+
+
+class TestParseRetryAfter:
+    """Tests for Retry-After header parsing."""
+
+    def test_missing(self):
+        assert _parse_retry_after(None) is None
+        assert _parse_retry_after("") is None
+
+    def test_delta_seconds(self):
+        assert _parse_retry_after("120") == 120
+
+    def test_zero_seconds(self):
+        assert _parse_retry_after("0") == 0
+
+    def test_negative_seconds_clamped(self):
+        assert _parse_retry_after("-5") == 0
+
+    def test_http_date_in_future(self):
+        retry_at = datetime.now(tz=timezone.utc) + timedelta(seconds=90)
+        seconds = _parse_retry_after(format_datetime(retry_at, usegmt=True))
+        assert 85 <= seconds <= 90
+
+    def test_http_date_in_past(self):
+        retry_at = datetime.now(tz=timezone.utc) - timedelta(hours=1)
+        assert _parse_retry_after(format_datetime(retry_at, usegmt=True)) == 0
+
+    def test_garbage(self):
+        assert _parse_retry_after("soon, maybe") is None
+
+
+class TestHandle429:
+    """Tests for 429 backoff deadlines."""
+
+    def test_retry_after_sets_deadline(self):
+        handler = RateLimitHandler("test")
+        handler.handle_429(retry_after=120)
+        remaining = handler.backoff_until - time.monotonic()
+        assert 115 < remaining <= 120
+
+    def test_retry_after_zero_allows_immediate_retry(self):
+        """Retry-After: 0 is honoured rather than replaced by jittered backoff."""
+        handler = RateLimitHandler("test")
+        handler.handle_429(retry_after=0)
+        assert handler.backoff_until <= time.monotonic()
+        assert handler.check_rate_limit() is True
+
+    def test_missing_retry_after_uses_capped_backoff(self):
+        handler = RateLimitHandler("test")
+        handler.handle_429()
+        remaining = handler.backoff_until - time.monotonic()
+        assert 0 <= remaining <= 60
+        assert handler.consecutive_429s == 1
+
+
+class TestAdaptiveRefillRate:
+    """Tests for AIMD adjustment of the token refill rate."""
+
+    def test_429_halves_rate_down_to_floor(self):
+        handler = RateLimitHandler("test", capacity=5, refill_rate=1.0)
+        handler.handle_429(retry_after=0)
+        assert handler._refill_rate == pytest.approx(0.5)
+
+        for _ in range(20):
+            handler.handle_429(retry_after=0)
+        assert handler._refill_rate == pytest.approx(RateLimitHandler.MIN_RATE_FRACTION)
+
+    def test_success_adds_step_up_to_cap(self):
+        handler = RateLimitHandler("test", capacity=5, refill_rate=1.0)
+        handler.handle_429(retry_after=0)
+        handler.record_success()
+        assert handler._refill_rate == pytest.approx(0.6)
+
+        for _ in range(20):
+            handler.record_success()
+        assert handler._refill_rate == pytest.approx(1.0)
+
+    def test_success_clears_backoff(self):
+        handler = RateLimitHandler("test")
+        handler.handle_429(retry_after=60)
+        handler.record_success()
+        assert handler.backoff_until is None
+        assert handler.consecutive_429s == 0
+
+    def test_reset_restores_configured_state(self):
+        handler = RateLimitHandler("test", capacity=5, refill_rate=1.0)
+        for _ in range(3):
+            handler.handle_429(retry_after=60)
+        handler.reset()
+        assert handler._refill_rate == 1.0
+        assert handler.backoff_until is None
+        assert handler.last_429_time is None
+        assert handler.check_rate_limit() is True
+
+
+class FakeResponse:
+    """Minimal requests.Response stand-in."""
+
+    def __init__(self, status_code=200, payload=None, headers=None):
+        self.status_code = status_code
+        self.content = json.dumps(payload or {}).encode()
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+
+class TestClientAdaptiveRate:
+    """Tests that real client requests drive the AIMD refill rate."""
+
+    @pytest.fixture
+    def client(self, fake_clock, monkeypatch):
+        """Exchange client with a private breaker and a scripted session."""
+        client = ExchangeRateClient()
+        client.circuit_breaker = SimpleCircuitBreaker("test", CircuitBreakerConfig())
+        client.rate_limiter = RateLimitHandler.for_circuit_breaker(
+            "test", client.circuit_breaker
+        )
+        self.responses = []
+        monkeypatch.setattr(
+            client._session, "get", lambda url, timeout: self.responses.pop(0)
+        )
+        yield client
+        client.close()
+
+    def test_429_then_successes(self, client, fake_clock):
+        max_rate = client.rate_limiter._refill_rate
+        self.responses = [
+            FakeResponse(429, headers={"Retry-After": "0"}),
+            FakeResponse(payload={"result": "success"}),
+        ]
+
+        assert client._make_request("https://example.test") is None
+        assert client.rate_limiter._refill_rate == pytest.approx(max_rate / 2)
+
+        assert client._make_request("https://example.test") == {"result": "success"}
+        assert client.rate_limiter._refill_rate == pytest.approx(max_rate * 0.6)
+
+    def test_slowed_bucket_makes_requests_wait(self, client, fake_clock):
+        """The first wait after a 429 uses the reduced refill rate."""
+        max_rate = client.rate_limiter._refill_rate
+        capacity = int(client.rate_limiter._capacity)
+        self.responses = [FakeResponse(429, headers={"Retry-After": "0"})] + [
+            FakeResponse(payload={"result": "success"}) for _ in range(capacity)
+        ]
+        for _ in range(capacity + 1):
+            client._make_request("https://example.test")
+
+        # Halved by the 429, then four successes add 10% each before the
+        # bucket runs dry
+        assert fake_clock.sleeps == [pytest.approx(1 / (0.9 * max_rate))]
+
+
+class TestFlightPricesBulk:
+    """Tests for concurrent flight price lookups."""
+
+    @pytest.fixture
+    def client(self):
+        """SerpApi client whose single-route lookup is stubbed per test."""
+        client = SerpApiClient()
+        yield client
+        client.close()
+
+    def test_duplicate_routes_fetched_once(self, client, monkeypatch):
+        calls = []
+
+        def fake_lookup(origin, destination):
+            calls.append((origin, destination))
+            return destination
+
+        monkeypatch.setattr(client, "get_flight_price", fake_lookup)
+        results = client.get_flight_prices_bulk(
+            [("TPE", "NRT"), ("TPE", "BKK"), ("TPE", "NRT")]
+        )
+
+        assert sorted(calls) == [("TPE", "BKK"), ("TPE", "NRT")]
+        assert results == {("TPE", "NRT"): "NRT", ("TPE", "BKK"): "BKK"}
+
+    def test_raising_lookup_maps_to_none(self, client, monkeypatch):
+        def fake_lookup(origin, destination):
+            if destination == "BKK":
+                raise RuntimeError("boom")
+            return destination
+
+        monkeypatch.setattr(client, "get_flight_price", fake_lookup)
+        results = client.get_flight_prices_bulk([("TPE", "NRT"), ("TPE", "BKK")])
+
+        assert results == {("TPE", "NRT"): "NRT", ("TPE", "BKK"): None}
+
+    def test_results_keyed_by_route(self, client, monkeypatch):
+        monkeypatch.setattr(
+            client, "get_flight_price",
+            lambda origin, destination: f"{origin}-{destination}"
+        )
+        routes = [("TPE", code) for code in ("NRT", "BKK", "SIN", "ICN", "HAN")]
+        results = client.get_flight_prices_bulk(routes, max_workers=3)
+
+        assert results == {route: f"{route[0]}-{route[1]}" for route in routes}
+
+    def test_empty_routes(self, client):
+        assert client.get_flight_prices_bulk([]) == {}
+
+    def test_more_routes_than_breaker_window(self, fake_clock, monkeypatch):
+        """Routes past the rate window are deferred, not rejected by the breaker."""
+        monkeypatch.setattr(api_clients, "_API_KEYS", {"SERPAPI_KEY": "test-key"})
+        client = SerpApiClient()
+        client.circuit_breaker = SimpleCircuitBreaker("test", CircuitBreakerConfig())
+        client.rate_limiter = RateLimitHandler.for_circuit_breaker(
+            "test", client.circuit_breaker
+        )
+        sent = []
+
+        def fake_send(request, timeout, **settings):
+            sent.append(request.url)
+            return FakeResponse(payload={"best_flights": [{"price": 12000}]})
+
+        monkeypatch.setattr(client._session, "send", fake_send)
+        threshold = client.circuit_breaker.config.rate_limit_threshold
+        routes = [("TPE", f"D{i:02d}") for i in range(threshold * 3)]
+        budget = client.rate_limiter.available_requests()
+
+        results = client.get_flight_prices_bulk(routes)
+        client.close()
+
+        assert budget < threshold
+        assert len(sent) == budget
+        assert set(results) == set(routes)
+        live = [route for route in routes if results[route] is not None]
+        assert live == routes[:budget]
+        assert client.circuit_breaker.stats.blocked_requests == 0
+
+
+class TestExchangeRateCache:
+    """Tests for the in-memory exchange rate cache."""
+
+    RAW_RATES = {"JPY": 4.6, "THB": 1.1}
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        """Configured exchange client with a stubbed network fetch."""
+        monkeypatch.setattr(api_clients, "_API_KEYS", {})
+        monkeypatch.setenv("EXCHANGERATE_API_KEY", "test-key")
+        client = ExchangeRateClient()
+        self.fetch_results = [dict(self.RAW_RATES)]
+        monkeypatch.setattr(
+            client, "_fetch_rates",
+            lambda base: self.fetch_results.pop(0) if self.fetch_results else None
+        )
+        yield client
+        client.close()
+
+    def _expire(self, client, base="TWD"):
+        """Age the cached entry past its TTL but within the stale window."""
+        entry = client._rates_cache[base]
+        entry.stored_at -= client._rates_ttl_seconds + 1
+        entry.fetched_at -= timedelta(seconds=client._rates_ttl_seconds + 1)
+        entry.validated.clear()
+
+    def test_fresh_rates_are_live(self, client):
+        rates = client.get_rates("TWD")
+        assert set(rates) == {"JPY", "THB"}
+        assert rates["JPY"].source is DataSource.LIVE_API
+        assert rates["JPY"].value == 4.6
+
+    def test_callers_get_independent_copies(self, client):
+        first = client.get_rates("TWD")
+        first["JPY"].value = 999
+        first["JPY"].validation_warnings.append("mutated")
+
+        second = client.get_rates("TWD")
+        assert second["JPY"] is not first["JPY"]
+        assert second["JPY"].value == 4.6
+        assert "mutated" not in second["JPY"].validation_warnings
+
+    def test_stale_rates_rewrapped_on_refresh_failure(self, client):
+        client.get_rates("TWD")
+        self._expire(client)
+
+        rates = client.get_rates("TWD")
+        assert rates["JPY"].source is DataSource.STALE_CACHE
+        assert rates["JPY"].value == 4.6
+        assert rates["JPY"].cache_age_seconds >= client._rates_ttl_seconds
+        assert rates["JPY"].quality_score < 100
+
+
+class TestApiKey:
+    """Tests for API key lookup."""
+
+    @pytest.fixture(autouse=True)
+    def empty_key_cache(self, monkeypatch):
+        monkeypatch.setattr(api_clients, "_API_KEYS", {})
+        monkeypatch.setattr(api_clients, "_ensure_env", lambda: False)
+
+    def test_missing_key_is_reread(self, monkeypatch):
+        """A key set after the first lookup is picked up by existing clients."""
+        monkeypatch.delenv("SERPAPI_KEY", raising=False)
+        client = SerpApiClient()
+        assert client.is_configured is False
+
+        monkeypatch.setenv("SERPAPI_KEY", "late-key")
+        assert client.is_configured is True
+        assert client.api_key == "late-key"
+        client.close()
+
+    def test_set_key_is_cached(self, monkeypatch):
+        monkeypatch.setenv("SERPAPI_KEY", "first-key")
+        assert api_clients._api_key("SERPAPI_KEY") == "first-key"
+
+        monkeypatch.setenv("SERPAPI_KEY", "second-key")
+        assert api_clients._api_key("SERPAPI_KEY") == "first-key"
+
+
+class TestDataFileCache:
+    """Tests for memoized bundled data files."""
+
+    @pytest.fixture
+    def col_path(self, tmp_path, monkeypatch):
+        """Temporary CoL data file with empty memos."""
+        path = tmp_path / "col.json"
+        monkeypatch.setattr(api_clients, "COL_DATA_PATH", path)
+        clear_data_caches()
+        yield path
+        clear_data_caches()
+
+    def _write_col(self, path, cost, keep_stat=False):
+        """Write a one-city CoL file, optionally keeping its size and mtime."""
+        payload = json.dumps(
+            {"cities": {"tokyo": {"country": "Japan", "monthly_cost_usd": cost}}}
+        ).encode()
+        stat = path.stat() if keep_stat else None
+        if stat is not None:
+            assert len(payload) == stat.st_size
+        path.write_bytes(payload)
+        if stat is not None:
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    def test_parse_is_shared(self, col_path):
+        self._write_col(col_path, 1800)
+        assert _load_json(col_path) is _load_json(col_path)
+
+    def test_same_stat_rewrite_needs_clear(self, col_path):
+        self._write_col(col_path, 1800)
+        assert get_col_for_country("Japan") == 1800
+
+        self._write_col(col_path, 1900, keep_stat=True)
+        assert get_col_for_country("Japan") == 1800
+
+        clear_data_caches()
+        assert get_col_for_country("Japan") == 1900
+        assert _load_json(col_path)["cities"]["tokyo"]["monthly_cost_usd"] == 1900
+
+    def test_mtime_change_reparses(self, col_path):
+        self._write_col(col_path, 1800)
+        assert get_col_for_country("Japan") == 1800
+
+        self._write_col(col_path, 2000)
+        later = col_path.stat().st_mtime_ns + 1_000_000_000
+        os.utime(col_path, ns=(later, later))
+        assert get_col_for_country("Japan") == 2000
@@ -0,0 +1,160 @@
+"""
+Unit tests for the JSON file cache.
+Tests cache writes, parse memoization and validation.
+"""
+
+import json
+import os
+
+import pytest
+from utils import cache
+from utils.api_clients import clear_data_caches
+from utils.cache import (
+    CACHE_VERSION,
+    PARSED_CACHE_MAX_BYTES,
+    clear_parsed_cache,
+    fetch_cached_data,
+    get_cache_path,
+    is_cache_stale_but_usable,
+    is_cache_valid,
+    save_cache,
+    _parse_cache_file_cached,
+    _atomic_write,
+    _read_cache_file,
+)
+from utils.data_quality import DataSource
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Point the cache at a temporary directory with empty memos."""
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path)
+    clear_parsed_cache()
+    yield tmp_path
+    clear_parsed_cache()
+
+
+def _rewrite_keeping_stat(path, payload):
+    """Rewrite a file with same-size contents and its previous mtime."""
+    stat = path.stat()
+    assert len(payload) == stat.st_size
+    path.write_bytes(payload)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+
+class TestSaveAndFetch:
+    """Tests for the save/fetch round trip."""
+
+    def test_round_trip(self):
+        assert save_cache("flights", {"price": 12000}, key="japan") is True
+
+        data, source = fetch_cached_data("flights", "japan")
+        assert data == {"price": 12000}
+        assert source is DataSource.CACHE
+
+    def test_miss_returns_default(self):
+        data, source = fetch_cached_data("flights", "nowhere", default={})
+        assert data == {}
+        assert source is DataSource.MOCK
+
+
+class TestAtomicWrite:
+    """Tests for temp-file-and-rename writes."""
+
+    def test_writes_payload_without_leftovers(self, cache_dir):
+        path = cache_dir / "exchange.json"
+        _atomic_write(path, b'{"a":1}', durable=True)
+
+        assert path.read_bytes() == b'{"a":1}'
+        assert [p.name for p in cache_dir.iterdir()] == ["exchange.json"]
+
+    def test_failed_rename_keeps_old_file_and_removes_temp(self, cache_dir, monkeypatch):
+        path = cache_dir / "exchange.json"
+        path.write_bytes(b'{"old":1}')
+
+        def failing_replace(src, dst):
+            raise OSError("rename failed")
+
+        monkeypatch.setattr(cache.os, "replace", failing_replace)
+        with pytest.raises(OSError):
+            _atomic_write(path, b'{"new":1}')
+
+        assert path.read_bytes() == b'{"old":1}'
+        assert [p.name for p in cache_dir.iterdir()] == ["exchange.json"]
+
+
+class TestParseMemo:
+    """Tests for memoized cache file parsing."""
+
+    def test_same_stat_rewrite_needs_clear(self):
+        path = get_cache_path("exchange")
+        path.write_bytes(b'{"rate": 1}')
+        assert _read_cache_file(path) == {"rate": 1}
+
+        _rewrite_keeping_stat(path, b'{"rate": 2}')
+        # Same (path, mtime_ns, size) key: the memo cannot tell
+        assert _read_cache_file(path) == {"rate": 1}
+
+        clear_parsed_cache()
+        assert _read_cache_file(path) == {"rate": 2}
+
+    def test_clear_data_caches_drops_parsed_cache_files(self):
+        path = get_cache_path("exchange")
+        path.write_bytes(b'{"rate": 1}')
+        _read_cache_file(path)
+
+        _rewrite_keeping_stat(path, b'{"rate": 3}')
+        clear_data_caches()
+        assert _read_cache_file(path) == {"rate": 3}
+
+    def test_save_cache_clears_memo(self):
+        save_cache("exchange", {"rates": {"JPY": 4.6}})
+        assert fetch_cached_data("exchange")[0] == {"rates": {"JPY": 4.6}}
+        path = get_cache_path("exchange")
+        before = path.stat()
+
+        save_cache("exchange", {"rates": {"JPY": 4.7}})
+        os.utime(path, ns=(before.st_atime_ns, before.st_mtime_ns))
+        assert fetch_cached_data("exchange")[0] == {"rates": {"JPY": 4.7}}
+
+    def test_large_files_not_memoized(self):
+        path = get_cache_path("flights", "big")
+        path.write_text(json.dumps({"blob": "x" * (PARSED_CACHE_MAX_BYTES + 1)}))
+
+        assert len(_read_cache_file(path)["blob"]) == PARSED_CACHE_MAX_BYTES + 1
+        assert _parse_cache_file_cached.cache_info().currsize == 0
+
+
+class TestValidation:
+    """Tests for cache validity checks and corruption handling."""
+
+    def _write_corrupted(self, version):
+        """Save a valid cache file, then tamper with its data and version."""
+        save_cache("exchange", {"rates": {"JPY": 4.6}})
+        path = get_cache_path("exchange")
+        data = json.loads(path.read_text())
+        data["rates"]["JPY"] = 9.9
+        data["_version"] = version
+        path.write_text(json.dumps(data))
+        clear_parsed_cache()
+        return path
+
+    def test_valid_file(self):
+        save_cache("exchange", {"rates": {"JPY": 4.6}})
+        assert is_cache_valid(get_cache_path("exchange"), "exchange") is True
+
+    def test_corrupted_current_version_is_deleted(self):
+        path = self._write_corrupted(CACHE_VERSION)
+        assert is_cache_valid(path, "exchange") is False
+        assert not path.exists()
+
+    def test_version_mismatch_is_invalid_but_kept(self):
+        """An outdated file is not treated as corrupted, even if its checksum fails."""
+        path = self._write_corrupted("0.9")
+        assert is_cache_valid(path, "exchange") is False
+        assert path.exists()
+
+    def test_stale_check_does_not_delete(self):
+        path = self._write_corrupted(CACHE_VERSION)
+        assert is_cache_stale_but_usable(path, "exchange") is False
+        assert path.exists()
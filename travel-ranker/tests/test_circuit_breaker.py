@@ -0,0 +1,111 @@
+"""
+Unit tests for the circuit breaker.
+Tests decorator wrapper caching and breaker behaviour through the wrapper.
+"""
+
+import gc
+import weakref
+
+import pytest
+from utils.circuit_breaker import (
+    CircuitBreakerOpenError,
+    get_circuit_breaker,
+    with_circuit_breaker,
+)
+
+
+@pytest.fixture
+def breaker_name(request):
+    """Unique breaker name per test, reset afterwards."""
+    name = f"test-{request.node.name}"
+    yield name
+    get_circuit_breaker(name).reset()
+
+
+class TestWithCircuitBreaker:
+    """Tests for with_circuit_breaker wrapper caching."""
+
+    def test_reapplying_returns_same_wrapper(self, breaker_name):
+        def fetch():
+            return 42
+
+        first = with_circuit_breaker(breaker_name)(fetch)
+        second = with_circuit_breaker(breaker_name)(fetch)
+
+        assert first is second
+        assert first() == 42
+        assert first.__wrapped__ is fetch
+
+    def test_wrappers_cached_per_breaker_name(self, breaker_name):
+        def fetch():
+            return 42
+
+        first = with_circuit_breaker(breaker_name)(fetch)
+        other = with_circuit_breaker(f"{breaker_name}-other")(fetch)
+
+        assert first is not other
+        assert with_circuit_breaker(f"{breaker_name}-other")(fetch) is other
+        get_circuit_breaker(f"{breaker_name}-other").reset()
+
+    def test_wrapper_does_not_share_function_cache(self, breaker_name):
+        """Wrapping a wrapper builds a new layer instead of returning itself."""
+        def fetch():
+            return 42
+
+        wrapper = with_circuit_breaker(breaker_name)(fetch)
+        outer = with_circuit_breaker(breaker_name)(wrapper)
+
+        assert outer is not wrapper
+        assert outer.__wrapped__ is wrapper
+
+    def test_cache_does_not_keep_function_alive(self, breaker_name):
+        def fetch():
+            return 42
+
+        with_circuit_breaker(breaker_name)(fetch)
+        ref = weakref.ref(fetch)
+        del fetch
+        gc.collect()
+
+        assert ref() is None
+
+    def test_uncacheable_callable_still_wrapped(self, breaker_name):
+        wrapped = with_circuit_breaker(breaker_name)(len)
+        assert wrapped([1, 2, 3]) == 3
+
+    def test_cached_wrapper_tracks_breaker_state(self, breaker_name):
+        calls = []
+
+        def failing():
+            calls.append(1)
+            raise RuntimeError("down")
+
+        breaker = get_circuit_breaker(breaker_name)
+        for _ in range(breaker.config.failure_threshold):
+            with pytest.raises(RuntimeError):
+                with_circuit_breaker(breaker_name)(failing)()
+
+        with pytest.raises(CircuitBreakerOpenError):
+            with_circuit_breaker(breaker_name)(failing)()
+        assert len(calls) == breaker.config.failure_threshold
+
+    def test_bound_methods_not_shared_between_instances(self, breaker_name):
+        class Client:
+            def __init__(self, value):
+                self.value = value
+
+            def fetch(self):
+                return self.value
+
+        a, b = Client("a"), Client("b")
+        assert with_circuit_breaker(breaker_name)(a.fetch)() == "a"
+        assert with_circuit_breaker(breaker_name)(b.fetch)() == "b"
+
+    def test_bound_method_after_class_function(self, breaker_name):
+        class Client:
+            def fetch(self):
+                return "bound"
+
+        unbound = with_circuit_breaker(breaker_name)(Client.fetch)
+        assert unbound(Client()) == "bound"
+        assert with_circuit_breaker(breaker_name)(Client().fetch)() == "bound"
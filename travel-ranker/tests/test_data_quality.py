@@ -0,0 +1,200 @@
+"""
+Unit tests for data quality and provenance tracking.
+Tests freshness, quality aggregation and serialization.
+"""
+
+import subprocess
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from utils.data_quality import (
+    DataSource,
+    DataWithProvenance,
+    DestinationDataQuality,
+    aggregate_quality_scores,
+    aggregate_quality_scores_soa,
+    get_quality_badge_html,
+    to_soa,
+    _quality_badge_html,
+)
+
+
+class TestDataWithProvenance:
+    """Tests for provenance-wrapped values."""
+
+    def test_fresh_api_value(self):
+        data = DataWithProvenance.from_api(4.6, field_name="exchange_rate_JPY")
+        assert data.source is DataSource.LIVE_API
+        assert data.is_fresh is True
+        assert data.freshness_level == "fresh"
+
+    def test_age_uses_shared_reference_time(self):
+        fetched_at = datetime.now() - timedelta(hours=2)
+        data = DataWithProvenance.from_api(4.6, fetched_at=fetched_at)
+        now = time.time()
+        assert data.age_seconds(now) == pytest.approx(now - fetched_at.timestamp())
+
+    def test_reassigned_fetched_at_updates_age(self):
+        """Reassigning the public fetched_at field is reflected in age and freshness."""
+        data = DataWithProvenance.from_api(4.6)
+        assert data.freshness_level == "fresh"
+
+        data.fetched_at = datetime.now() - timedelta(days=3)
+        assert data.age_seconds() == pytest.approx(3 * 86400, abs=5)
+        assert data.freshness_level == "stale"
+        assert data.fetched_epoch == data.fetched_at.timestamp()
+
+
+class TestDestinationDataQuality:
+    """Tests for per-destination quality aggregation."""
+
+    def test_empty_quality(self):
+        quality = DestinationDataQuality(country_key="japan", country_name="Japan")
+        assert quality.overall_quality_score == 0.0
+        assert quality.primary_source is DataSource.MOCK
+        assert quality.has_expanded_data is False
+
+    def test_legacy_weighted_score(self):
+        quality = DestinationDataQuality(
+            country_key="japan",
+            country_name="Japan",
+            exchange_data=DataWithProvenance.from_api(4.6, quality_score=100),
+            flight_data=DataWithProvenance.from_baseline(12000),
+            col_data=DataWithProvenance.from_api(1800, quality_score=80),
+        )
+        expected = (100 * 0.30 + 40 * 0.20 + 80 * 0.50) / 1.0
+        assert quality.overall_quality_score == pytest.approx(expected)
+        assert quality.primary_source is DataSource.BASELINE
+
+    def test_fields_assigned_after_construction(self):
+        """Derived properties follow *_data fields assigned after construction."""
+        quality = DestinationDataQuality(
+            country_key="japan",
+            country_name="Japan",
+            exchange_data=DataWithProvenance.from_api(4.6),
+        )
+        assert quality.primary_source is DataSource.LIVE_API
+        assert quality.has_expanded_data is False
+
+        quality.safety_data = DataWithProvenance.from_baseline(85)
+        assert quality.has_expanded_data is True
+        assert quality.primary_source is DataSource.BASELINE
+        assert quality.to_dict()["primary_source"] == "baseline"
+
+
+class TestImportCost:
+    """Tests that array helpers keep numpy off the import path."""
+
+    def test_cache_and_api_clients_do_not_load_numpy(self):
+        code = (
+            "import sys, utils.cache, utils.api_clients; "
+            "sys.exit('numpy' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).parent.parent,
+        )
+        assert result.returncode == 0
+
+
+class TestQualityBadge:
+    """Tests for the quality badge HTML."""
+
+    def test_tier_uses_unrounded_score(self):
+        """79.6 displays as 80 but stays in the Good tier."""
+        html = get_quality_badge_html(79.6)
+        assert "Good Quality (80%)" in html
+
+    @pytest.mark.parametrize("score,label", [
+        (0, "Low Quality (0%)"),
+        (40, "Fair Quality (40%)"),
+        (60, "Good Quality (60%)"),
+        (100, "High Quality (100%)"),
+    ])
+    def test_tiers(self, score, label):
+        assert label in get_quality_badge_html(score)
+
+    def test_nearby_scores_share_cache_entry(self):
+        _quality_badge_html.cache_clear()
+        first = get_quality_badge_html(85.12)
+        second = get_quality_badge_html(84.87)
+
+        assert first == second
+        info = _quality_badge_html.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+
+def _sample_qualities():
+    """Destinations with mixed sources, ages and expanded indicators."""
+    now = datetime.now()
+    return [
+        DestinationDataQuality(
+            country_key="japan",
+            country_name="Japan",
+            exchange_data=DataWithProvenance.from_api(4.6, quality_score=95),
+            flight_data=DataWithProvenance.from_cache(12000, now - timedelta(hours=5)),
+            col_data=DataWithProvenance.from_api(1800, quality_score=90),
+            safety_data=DataWithProvenance.from_baseline(85),
+        ),
+        DestinationDataQuality(
+            country_key="thailand",
+            country_name="Thailand",
+            exchange_data=DataWithProvenance.from_cache(
+                1.1, now - timedelta(days=3), is_stale=True
+            ),
+            col_data=DataWithProvenance.from_mock(1200),
+        ),
+        DestinationDataQuality(
+            country_key="vietnam",
+            country_name="Vietnam",
+            exchange_data=DataWithProvenance.from_api(780.0),
+            flight_data=DataWithProvenance.from_baseline(
+                9000, baseline_date=now - timedelta(days=30)
+            ),
+            col_data=DataWithProvenance.from_baseline(1000),
+        ),
+    ]
+
+
+class TestStructureOfArrays:
+    """Tests for the array view and its aggregation."""
+
+    def test_to_soa_layout(self):
+        qualities = _sample_qualities()
+        arrays = to_soa(qualities)
+
+        assert len(arrays) == 3
+        assert arrays.quality_scores.shape == (3, 6)
+        # Thailand has no flight (column 1) or expanded data
+        assert arrays.presence_mask[1].tolist() == [True, False, True, False, False, False]
+        assert arrays.fetched_epoch[0, 0] == qualities[0].exchange_data.fetched_epoch
+        assert arrays.overall_scores.tolist() == [q.overall_quality_score for q in qualities]
+
+    def test_aggregate_matches_scalar_path(self):
+        """Array aggregation matches per-object statistics."""
+        qualities = _sample_qualities()
+        now = time.time()
+        result = aggregate_quality_scores_soa(to_soa(qualities), now=now)
+
+        scores = [q.overall_quality_score for q in qualities]
+        freshness = Counter(
+            level
+            for q in qualities
+            for level in q.get_freshness_summary(now).values()
+        )
+        assert result["average_quality"] == round(sum(scores) / len(scores), 1)
+        assert result["min_quality"] == round(min(scores), 1)
+        assert result["max_quality"] == round(max(scores), 1)
+        assert result["source_distribution"] == dict(
+            Counter(q.primary_source.value for q in qualities)
+        )
+        assert result["freshness_distribution"] == dict(freshness)
+        assert result["total_destinations"] == 3
+
+    def test_aggregate_empty(self):
+        assert aggregate_quality_scores([])["average_quality"] == 0
+
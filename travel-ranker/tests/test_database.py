@@ -0,0 +1,181 @@
+"""
+Unit tests for the SQLite history database.
+Tests snapshot writes and connection settings.
+"""
+
+import json
+from datetime import date
+
+import pytest
+from utils import database
+from utils.data_quality import DataSource, ProvenanceMetadata
+from utils.database import (
+    get_connection,
+    init_database,
+    store_daily_snapshot,
+    store_daily_snapshots_bulk,
+)
+
+SNAPSHOT_DATE = date(2026, 1, 15)
+
+# Every stored column except the autoincrement id and insert timestamp
+SNAPSHOT_COLUMNS = (
+    "snapshot_date, country_key, country_name, final_score, overall_change, "
+    "exchange_score, exchange_change, exchange_rate, "
+    "flight_score, flight_change, flight_cost, "
+    "col_score, col_change, col_amount, badges, "
+    "data_source, data_quality_score, exchange_source, flight_source, col_source"
+)
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    """Point the database at a fresh temporary file."""
+    path = tmp_path / "travel_ranker.db"
+    monkeypatch.setattr(database, "DB_PATH", path)
+    init_database()
+    return path
+
+
+def _score_data(final_score):
+    return {
+        "final_score": final_score,
+        "overall_change": 3.5,
+        "components": {
+            "exchange": {"score": 60.0, "change": 2.0, "current": 4.6},
+            "flight": {"score": 55.0, "change": -1.0, "current": 12000},
+            "col": {"score": 70.0, "change": 5.0, "current": 1800},
+        },
+    }
+
+
+def _records():
+    return [
+        {
+            "country_key": "japan",
+            "country_name": "Japan",
+            "score_data": _score_data(72.5),
+            "badges": ["EXCELLENT"],
+            "snapshot_date": SNAPSHOT_DATE,
+            "provenance": ProvenanceMetadata(
+                data_source=DataSource.LIVE_API,
+                data_quality_score=92.0,
+                exchange_source="live_api",
+                flight_source="cache",
+                col_source="baseline",
+            ),
+        },
+        {
+            "country_key": "thailand",
+            "country_name": "Thailand",
+            "score_data": _score_data(64.0),
+            "badges": [],
+            "snapshot_date": SNAPSHOT_DATE,
+        },
+    ]
+
+
+def _stored_rows():
+    conn = get_connection()
+    try:
+        rows = conn.execute(
+            f"SELECT {SNAPSHOT_COLUMNS} FROM daily_snapshots ORDER BY country_key"
+        ).fetchall()
+        return [tuple(row) for row in rows]
+    finally:
+        conn.close()
+
+
+class TestStoreSnapshots:
+    """Tests for single and bulk snapshot writes."""
+
+    def test_single_row_values(self, db_path):
+        record = _records()[1]
+        assert store_daily_snapshot(**record) is True
+
+        assert _stored_rows() == [(
+            "2026-01-15", "thailand", "Thailand", 64.0, 3.5,
+            60.0, 2.0, 4.6,
+            55.0, -1.0, 12000.0,
+            70.0, 5.0, 1800.0,
+            json.dumps([]),
+            "baseline", 50.0, "baseline", "baseline", "baseline",
+        )]
+
+    def test_bulk_matches_per_row_writes(self, db_path, tmp_path, monkeypatch):
+        for record in _records():
+            assert store_daily_snapshot(**record) is True
+        per_row = _stored_rows()
+
+        monkeypatch.setattr(database, "DB_PATH", tmp_path / "bulk.db")
+        init_database()
+        assert store_daily_snapshots_bulk(_records()) is True
+
+        assert _stored_rows() == per_row
+        assert len(per_row) == 2
+
+    def test_failing_row_rolls_back_batch(self, db_path):
+        records = _records()
+        records[1]["country_name"] = None  # violates NOT NULL
+
+        assert store_daily_snapshots_bulk(records) is False
+        assert _stored_rows() == []
+
+    @pytest.mark.parametrize("change", [
+        {"score_data": None},             # wrong type
+        {"unexpected": 1},                # unknown key
+        {"badges": {object()}},           # not JSON serializable
+    ])
+    def test_malformed_record_returns_false(self, db_path, change):
+        records = _records()
+        records[1].update(change)
+
+        assert store_daily_snapshots_bulk(records) is False
+        assert _stored_rows() == []
+
+    def test_missing_key_returns_false(self, db_path):
+        records = _records()
+        del records[0]["score_data"]
+
+        assert store_daily_snapshots_bulk(records) is False
+        assert _stored_rows() == []
+
+    def test_empty_batch(self, db_path):
+        assert store_daily_snapshots_bulk([]) is True
+        assert _stored_rows() == []
+
+
+class TestConnection:
+    """Tests for connection PRAGMAs and journal mode."""
+
+    def _pragma(self, conn, name):
+        return conn.execute(f"PRAGMA {name}").fetchone()[0]
+
+    def test_wal_mode(self, db_path):
+        conn = get_connection()
+        try:
+            assert self._pragma(conn, "journal_mode") == "wal"
+        finally:
+            conn.close()
+
+    def test_connection_pragmas(self, db_path):
+        conn = get_connection()
+        try:
+            assert self._pragma(conn, "synchronous") == 1  # NORMAL
+            assert self._pragma(conn, "temp_store") == 2  # MEMORY
+            assert self._pragma(conn, "cache_size") == -20000
+            assert self._pragma(conn, "busy_timeout") == 5000
+        finally:
+            conn.close()
+
+    def test_wal_restored_after_file_recreated(self, db_path):
+        """A database deleted and recreated mid-process is put back into WAL."""
+        get_connection().close()
+        for suffix in ("", "-wal", "-shm"):
+            db_path.with_name(db_path.name + suffix).unlink(missing_ok=True)
+
+        conn = get_connection()
+        try:
+            assert self._pragma(conn, "journal_mode") == "wal"
+        finally:
+            conn.close()
@@ -344,6 +344,23 @@ class TestExpandedDestinationScore:
         assert "visa" not in result["components"]
         assert "access" not in result["components"]
 
+    @pytest.mark.parametrize("missing", ["safety_index", "visa_score", "access_score"])
+    def test_destination_score_legacy_when_one_indicator_missing(self, missing):
+        """Any single missing indicator falls back to legacy scoring."""
+        indicators = {"safety_index": 90.0, "visa_score": 100.0, "access_score": 85.0}
+        indicators[missing] = None
+        result = calculate_destination_score(
+            current_exchange_rate=1.0,
+            baseline_exchange_rate=1.0,
+            current_flight_cost=10000,
+            baseline_flight_cost=10000,
+            current_col=1500,
+            baseline_col=1500,
+            use_expanded_scoring=True,
+            **indicators
+        )
+        assert result["scoring_version"] == "legacy"
+
     def test_destination_score_expanded_vs_legacy(self):
         """Expanded scoring produces different results than legacy."""
         expanded = calculate_destination_score(
@@ -21,6 +21,7 @@ from utils.scoring import (
     LEGACY_FLIGHT_WEIGHT,
     LEGACY_EXCHANGE_WEIGHT,
     LEGACY_COL_WEIGHT,
+    EXPANDED_WEIGHTS,
 )
 
 
@@ -40,6 +41,10 @@ class TestClip:
         assert clip(0, 0, 100) == 0
         assert clip(100, 0, 100) == 100
 
+    def test_clip_nan_returns_max(self):
+        """NaN clips to the upper bound, matching the original min/max form."""
+        assert clip(float("nan"), 0, 100) == 100
+
 
 class TestExchangeScore:
     """Tests for exchange rate scoring."""
@@ -151,6 +156,34 @@ class TestDestinationScore:
         legacy_sum = LEGACY_EXCHANGE_WEIGHT + LEGACY_FLIGHT_WEIGHT + LEGACY_COL_WEIGHT
         assert legacy_sum == 1.0
 
+    def test_component_weights_match_scoring_version(self):
+        """Component weights come from the weight set of the scoring version used."""
+        legacy = calculate_destination_score(
+            current_exchange_rate=1.0, baseline_exchange_rate=1.0,
+            current_flight_cost=10000, baseline_flight_cost=10000,
+            current_col=1500, baseline_col=1500,
+        )
+        expanded = calculate_destination_score(
+            current_exchange_rate=1.0, baseline_exchange_rate=1.0,
+            current_flight_cost=10000, baseline_flight_cost=10000,
+            current_col=1500, baseline_col=1500,
+            safety_index=70, visa_score=80, access_score=60,
+        )
+
+        assert legacy["scoring_version"] == "legacy"
+        assert legacy["components"]["exchange"]["weight"] == LEGACY_EXCHANGE_WEIGHT
+        assert legacy["components"]["col"]["weight"] == LEGACY_COL_WEIGHT
+        assert expanded["scoring_version"] == "expanded"
+        assert expanded["components"]["flight"]["weight"] == FLIGHT_WEIGHT
+        assert expanded["components"]["safety"]["weight"] == SAFETY_WEIGHT
+        assert expanded["components"]["access"]["weight"] == ACCESS_WEIGHT
+
+    def test_scoring_weights_are_slotted(self):
+        """Weight sets are frozen and carry no per-instance __dict__."""
+        assert not hasattr(EXPANDED_WEIGHTS, "__dict__")
+        with pytest.raises(AttributeError):
+            EXPANDED_WEIGHTS.col = 0.5
+
     def test_baseline_scenario(self):
         """All values at baseline should give moderate score."""
         result = calculate_destination_score(
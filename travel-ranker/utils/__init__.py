@@ -1,21 +1,41 @@
 """Utility modules for Travel Ranker."""
 
-from .scoring import calculate_destination_score, assign_badges, get_trend_arrow
-from .cache import fetch_cached_data, save_cache, get_cache_path
-from .database import init_database, store_daily_snapshot, get_history
-from .api_clients import SerpApiClient, ExchangeRateClient, get_col_data
-
-__all__ = [
-    "calculate_destination_score",
-    "assign_badges",
-    "get_trend_arrow",
-    "fetch_cached_data",
-    "save_cache",
-    "get_cache_path",
-    "init_database",
-    "store_daily_snapshot",
-    "get_history",
-    "SerpApiClient",
-    "ExchangeRateClient",
-    "get_col_data",
-]
+from importlib import import_module
+from typing import Any, List
+
+# Re-exports are resolved on first attribute access (PEP 562) so that
+# importing a single submodule, e.g. ``utils.scoring``, does not drag in
+# api_clients and its requests/tenacity dependencies.
+_LAZY_EXPORTS = {
+    "calculate_destination_score": "scoring",
+    "assign_badges": "scoring",
+    "get_trend_arrow": "scoring",
+    "fetch_cached_data": "cache",
+    "save_cache": "cache",
+    "get_cache_path": "cache",
+    "init_database": "database",
+    "store_daily_snapshot": "database",
+    "store_daily_snapshots_bulk": "database",
+    "get_history": "database",
+    "SerpApiClient": "api_clients",
+    "ExchangeRateClient": "api_clients",
+    "get_col_data": "api_clients",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the owning submodule on first access to a re-exported name."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    """Include lazy re-exports in dir() output."""
+    return sorted(set(globals()) | set(__all__))
@@ -9,44 +9,46 @@ Enhanced with:
 - Rate limit handling
 """
 
+import importlib.util
 import os
 import json
+import random
 import time
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from functools import cache, lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Dict, Any, Optional
+from threading import Lock
+from typing import Dict, Any, List, Optional, Set, Tuple
 
 import requests
-from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 
+# tenacity is only probed here; the import itself is deferred to _tenacity()
+TENACITY_AVAILABLE = importlib.util.find_spec("tenacity") is not None
+
+# orjson is optional; stdlib json is the fallback
 try:
-    from tenacity import (
-        retry,
-        stop_after_attempt,
-        wait_exponential,
-        retry_if_exception_type,
-        before_sleep_log,
-        RetryError
-    )
-    TENACITY_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    TENACITY_AVAILABLE = False
+    ORJSON_AVAILABLE = False
 
 from utils.logging_config import get_logger, log_api_call, metrics
 from utils.circuit_breaker import (
     get_circuit_breaker,
-    CircuitBreakerOpenError
+    CircuitBreakerOpenError,
+    SimpleCircuitBreaker,
 )
 from utils.validators import (
-    FlightPriceResponse,
-    ExchangeRateResponse,
     validate_exchange_rate,
     validate_flight_cost,
 )
 from utils.data_quality import DataWithProvenance, DataSource
-
-# Load environment variables
-load_dotenv()
+from utils.cache import CACHE_TTL, STALE_TTL_MULTIPLIER, clear_parsed_cache
 
 # Logger
 logger = get_logger("api_client")
@@ -58,10 +60,64 @@ COUNTRIES_PATH = DATA_DIR / "countries.json"
 BASELINES_V2_PATH = DATA_DIR / "baselines_v2.json"
 
 
+# ============================================================================
+# Environment
+# ============================================================================
+
+@cache
+def _ensure_env() -> bool:
+    """
+    Load environment variables from .env once, on first client construction.
+
+    Keeps the filesystem lookup off the import path for code that never
+    talks to an API (scoring, tests).
+
+    Returns:
+        True if a .env file was found and loaded
+    """
+    from dotenv import load_dotenv
+    return load_dotenv()
+
+
+# Non-empty API keys by environment variable name
+_API_KEYS: Dict[str, str] = {}
+
+
+def _api_key(env_var: str) -> str:
+    """
+    Read an API key from the environment, caching it once it is set.
+
+    An empty value is not cached, so a key that appears later (a .env or
+    secrets file loaded after first use) is still picked up.
+
+    Args:
+        env_var: Environment variable name
+
+    Returns:
+        API key, or empty string if unset
+    """
+    key = _API_KEYS.get(env_var)
+    if key:
+        return key
+
+    _ensure_env()
+    key = os.getenv(env_var, "")
+    if key:
+        _API_KEYS[env_var] = key
+    return key
+
+
 # ============================================================================
 # Retry Configuration
 # ============================================================================
 
+@cache
+def _tenacity():
+    """Import tenacity on first use so importing this module stays cheap."""
+    import tenacity
+    return tenacity
+
+
 def create_retry_decorator(api_name: str):
     """
     Create a retry decorator for API calls.
@@ -75,50 +131,277 @@ def create_retry_decorator(api_name: str):
     if not TENACITY_AVAILABLE:
         return lambda f: f
 
-    return retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((
+    tenacity = _tenacity()
+    return tenacity.retry(
+        stop=tenacity.stop_after_attempt(3),
+        wait=tenacity.wait_exponential(multiplier=1, min=2, max=10),
+        retry=tenacity.retry_if_exception_type((
             requests.RequestException,
             requests.Timeout,
             ConnectionError,
         )),
-        before_sleep=before_sleep_log(logger, log_level=20),  # INFO level
+        before_sleep=tenacity.before_sleep_log(logger, log_level=20),  # INFO level
         reraise=True
     )
 
 
+# ============================================================================
+# HTTP Session
+# ============================================================================
+
+def _create_session() -> requests.Session:
+    """
+    Create a pooled HTTP session so repeated calls reuse keep-alive connections.
+
+    Retries are left to tenacity, so the adapter itself never retries.
+
+    Returns:
+        Configured requests session
+    """
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+    )
+    return session
+
+
+def _json_loads(data: bytes) -> Any:
+    """
+    Parse JSON bytes, using orjson when installed.
+
+    Both parsers raise a json.JSONDecodeError subclass on bad input.
+
+    Args:
+        data: Raw JSON bytes
+
+    Returns:
+        Parsed JSON value
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _parse_json_response(response: requests.Response) -> Any:
+    """
+    Parse a response body straight from bytes, skipping charset detection.
+
+    Args:
+        response: HTTP response
+
+    Returns:
+        Parsed JSON value
+
+    Raises:
+        requests.JSONDecodeError: If the body is not valid JSON, matching
+            response.json() so existing RequestException handlers apply
+    """
+    try:
+        return _json_loads(response.content)
+    except json.JSONDecodeError as e:
+        raise requests.JSONDecodeError(e.msg, e.doc, e.pos) from e
+
+
 # ============================================================================
 # Rate Limit Handler
 # ============================================================================
 
+def _parse_retry_after(value: Optional[str]) -> Optional[int]:
+    """
+    Parse a Retry-After header value.
+
+    RFC 7231 allows either delta-seconds ("120") or an HTTP-date
+    ("Wed, 21 Oct 2026 07:28:00 GMT").
+
+    Args:
+        value: Raw header value
+
+    Returns:
+        Seconds to wait, or None if missing or unparseable
+    """
+    if not value:
+        return None
+
+    try:
+        return max(0, int(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        logger.warning(f"Unparseable Retry-After header: {value!r}")
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0, int((retry_at - datetime.now(tz=timezone.utc)).total_seconds()))
+
+
 class RateLimitHandler:
     """
     Handles rate limiting with backoff strategy.
+
+    429 backoff uses a deadline on time.monotonic(), so checks are plain
+    float comparisons and wall-clock adjustments cannot shorten or extend
+    a backoff.
+
+    By default there is no client-side cap: only server-driven backoff
+    (429 / Retry-After) blocks requests. Passing a capacity adds a token
+    bucket that paces requests. An empty bucket makes the caller wait for
+    its token instead of dropping the request. The API clients build their
+    bucket with for_circuit_breaker, sized to the breaker's request window.
+
+    The bucket's refill rate adapts AIMD-style: each success adds a small
+    step back toward the configured rate, each 429 halves it.
+
+    State changes are guarded by a lock so one handler can gate concurrent
+    workers (see SerpApiClient.get_flight_prices_bulk).
     """
 
-    def __init__(self, api_name: str):
+    RATE_INCREASE_FRACTION = 0.1   # Additive step, as a fraction of max rate
+    RATE_DECREASE_FACTOR = 0.5     # Multiplicative cut on 429
+    MIN_RATE_FRACTION = 0.01       # Floor, as a fraction of max rate
+    MAX_TOKEN_WAIT_SECONDS = 30.0  # Longest a caller waits for a token
+
+    def __init__(
+        self,
+        api_name: str,
+        capacity: Optional[float] = None,
+        refill_rate: float = 10.0 / 60.0
+    ):
+        """
+        Initialize rate limit handler.
+
+        Args:
+            api_name: Name of API for logging
+            capacity: Maximum burst of requests (bucket size), or None for
+                no client-side cap
+            refill_rate: Maximum tokens added per second (ignored without
+                a capacity)
+        """
         self.api_name = api_name
         self.last_429_time: Optional[datetime] = None
-        self.backoff_until: Optional[datetime] = None
+        self.backoff_until: Optional[float] = None  # time.monotonic() deadline
         self.consecutive_429s = 0
 
+        # Token bucket
+        self._capacity = capacity
+        self._max_refill_rate = refill_rate
+        self._min_refill_rate = refill_rate * self.MIN_RATE_FRACTION
+        self._refill_rate = refill_rate
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+        self._lock = Lock()
+
+    @classmethod
+    def for_circuit_breaker(
+        cls,
+        api_name: str,
+        circuit_breaker: SimpleCircuitBreaker
+    ) -> "RateLimitHandler":
+        """
+        Create a token bucket that stays inside a circuit breaker's rate window.
+
+        Half the window's allowance is available as a burst and the other
+        half refills evenly over the window, so the bucket never admits more
+        requests in any window than the breaker does.
+
+        Args:
+            api_name: Name of API for logging
+            circuit_breaker: Breaker whose rate_limit_threshold and
+                rate_limit_window bound the requests
+
+        Returns:
+            RateLimitHandler with a paced token bucket
+        """
+        config = circuit_breaker.config
+        burst = config.rate_limit_threshold / 2
+        return cls(
+            api_name,
+            capacity=burst,
+            refill_rate=burst / config.rate_limit_window
+        )
+
     def check_rate_limit(self) -> bool:
         """
         Check if we should make a request or wait.
 
+        With a token bucket, reserves one token. If the bucket is empty the
+        call sleeps until that token is due, up to MAX_TOKEN_WAIT_SECONDS.
+
         Returns:
             True if request can proceed, False if should wait
         """
-        if self.backoff_until and datetime.now() < self.backoff_until:
-            remaining = (self.backoff_until - datetime.now()).total_seconds()
+        # Only the state update holds the lock; logging and sleeping happen
+        # after release
+        with self._lock:
+            now = time.monotonic()
+
+            if self.backoff_until is not None and now < self.backoff_until:
+                backoff_remaining = self.backoff_until - now
+            elif self._capacity is None:
+                return True
+            else:
+                backoff_remaining = None
+
+                # Refill for elapsed time, then reserve a token. The balance
+                # may go negative; the deficit is this caller's wait, so
+                # concurrent workers queue instead of failing.
+                self._tokens = min(
+                    self._capacity,
+                    self._tokens + (now - self._last_refill) * self._refill_rate
+                )
+                self._last_refill = now
+
+                wait_seconds = (1 - self._tokens) / self._refill_rate
+                if wait_seconds <= self.MAX_TOKEN_WAIT_SECONDS:
+                    self._tokens -= 1
+
+        if backoff_remaining is not None:
             logger.warning(
                 f"Rate limit backoff active for {self.api_name}",
-                extra={"backoff_remaining_seconds": remaining}
+                extra={"backoff_remaining_seconds": backoff_remaining}
+            )
+            return False
+
+        if wait_seconds > self.MAX_TOKEN_WAIT_SECONDS:
+            logger.warning(
+                f"Client-side rate limit reached for {self.api_name}",
+                extra={"token_wait_seconds": round(wait_seconds, 1)}
             )
             return False
+
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
         return True
 
+    def available_requests(self) -> Optional[int]:
+        """
+        Count the requests check_rate_limit would admit right now.
+
+        Includes tokens already in the bucket plus those that refill within
+        MAX_TOKEN_WAIT_SECONDS, so callers can size a batch to what will
+        actually go out instead of queueing requests that would be refused.
+
+        Returns:
+            Number of requests, 0 during a 429 backoff, or None without a
+            token bucket
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self.backoff_until is not None and now < self.backoff_until:
+                return 0
+            if self._capacity is None:
+                return None
+
+            tokens = min(
+                self._capacity,
+                self._tokens + (now - self._last_refill) * self._refill_rate
+            )
+            return max(0, int(tokens + self._refill_rate * self.MAX_TOKEN_WAIT_SECONDS))
+
     def handle_429(self, retry_after: Optional[int] = None) -> None:
         """
         Handle 429 rate limit response.
@@ -126,83 +409,183 @@ class RateLimitHandler:
         Args:
             retry_after: Retry-After header value in seconds
         """
-        self.consecutive_429s += 1
-        self.last_429_time = datetime.now()
-
-        # Calculate backoff time
-        if retry_after:
-            backoff_seconds = retry_after
-        else:
-            # Exponential backoff: 60, 120, 240, 480... capped at 30 minutes
-            backoff_seconds = min(60 * (2 ** (self.consecutive_429s - 1)), 1800)
-
-        self.backoff_until = datetime.now() + timedelta(seconds=backoff_seconds)
+        with self._lock:
+            self.consecutive_429s += 1
+            consecutive_429s = self.consecutive_429s
+            self.last_429_time = datetime.now()
+
+            # Calculate backoff time
+            # Retry-After: 0 is a valid "retry now", not a missing header
+            if retry_after is not None:
+                backoff_seconds = retry_after
+            else:
+                # Full-jitter exponential backoff: uniform in [0, cap] where the cap
+                # grows 60, 120, 240, 480... up to 30 minutes. Spreads retries from
+                # clients that were throttled together.
+                cap = min(60 * (2 ** (consecutive_429s - 1)), 1800)
+                backoff_seconds = random.uniform(0, cap)
+
+            self.backoff_until = time.monotonic() + backoff_seconds
+            self._refill_rate = max(
+                self._min_refill_rate,
+                self._refill_rate * self.RATE_DECREASE_FACTOR
+            )
+            refill_rate = self._refill_rate
 
         logger.warning(
             f"Rate limit hit for {self.api_name}",
             extra={
-                "consecutive_429s": self.consecutive_429s,
+                "consecutive_429s": consecutive_429s,
                 "backoff_seconds": backoff_seconds,
+                "refill_rate": refill_rate,
             }
         )
         metrics.record_error("rate_limit_429")
 
+    def record_success(self) -> None:
+        """
+        Record a successful request.
+
+        Clears the 429 backoff and raises the refill rate by one additive
+        step, capped at the configured rate.
+        """
+        with self._lock:
+            self.consecutive_429s = 0
+            self.backoff_until = None
+            self._refill_rate = min(
+                self._max_refill_rate,
+                self._refill_rate + self._max_refill_rate * self.RATE_INCREASE_FRACTION
+            )
+
     def reset(self) -> None:
-        """Reset rate limit state after successful request."""
-        self.consecutive_429s = 0
-        self.backoff_until = None
+        """Reset all rate limit state, restoring the configured refill rate."""
+        with self._lock:
+            self.consecutive_429s = 0
+            self.backoff_until = None
+            self.last_429_time = None
+            self._refill_rate = self._max_refill_rate
+            self._tokens = self._capacity
+            self._last_refill = time.monotonic()
 
 
 # ============================================================================
 # SerpApi Client
 # ============================================================================
 
+@lru_cache(maxsize=1)
+def _default_departure_date(today_ordinal: int) -> str:
+    """
+    Default departure date, 30 days from today.
+
+    Args:
+        today_ordinal: date.today().toordinal(), so the value rolls over daily
+
+    Returns:
+        Date string (YYYY-MM-DD)
+    """
+    return (date.fromordinal(today_ordinal) + timedelta(days=30)).isoformat()
+
+
+@lru_cache(maxsize=32)
+def _default_return_date(departure_date: str) -> str:
+    """
+    Default return date, 7 days after departure.
+
+    Args:
+        departure_date: Departure date (YYYY-MM-DD)
+
+    Returns:
+        Date string (YYYY-MM-DD)
+    """
+    return (date.fromisoformat(departure_date) + timedelta(days=7)).isoformat()
+
+
 class SerpApiClient:
     """Client for SerpApi Google Flights with resilience features."""
 
     BASE_URL = "https://serpapi.com/search"
+    API_KEY_ENV = "SERPAPI_KEY"
 
     def __init__(self):
-        self.api_key = os.getenv("SERPAPI_KEY", "")
         self.circuit_breaker = get_circuit_breaker("serpapi")
-        self.rate_limiter = RateLimitHandler("serpapi")
+        self.rate_limiter = RateLimitHandler.for_circuit_breaker(
+            "serpapi", self.circuit_breaker
+        )
+        self._session = _create_session()
+
+    @property
+    def api_key(self) -> str:
+        """API key, re-read from the environment until one is set."""
+        return _api_key(self.API_KEY_ENV)
 
     @property
     def is_configured(self) -> bool:
         """Check if API key is configured."""
         return bool(self.api_key)
 
+    def close(self) -> None:
+        """Close pooled HTTP connections."""
+        self._session.close()
+
+    def _prepare_request(self, params: Dict[str, Any]) -> requests.PreparedRequest:
+        """
+        Build and URL-encode a search request once, so retries can resend it.
+
+        Args:
+            params: Search parameters, without the API key
+
+        Returns:
+            Prepared GET request
+        """
+        return self._session.prepare_request(
+            requests.Request(
+                "GET",
+                self.BASE_URL,
+                params={**params, "api_key": self.api_key}
+            )
+        )
+
     def _make_request(
         self,
-        params: Dict[str, Any],
-        timeout: int = 30
+        request: requests.PreparedRequest,
+        timeout: int = 30,
+        raise_on_open: bool = True
     ) -> Optional[Dict[str, Any]]:
         """
         Make HTTP request with error handling.
 
         Args:
-            params: Request parameters
+            request: Request from _prepare_request
             timeout: Request timeout in seconds
+            raise_on_open: Raise CircuitBreakerOpenError when the circuit is
+                open; if False, return None without building an exception
 
         Returns:
             JSON response or None
         """
+        # Check rate limit first: waiting for a token happens here, before
+        # the circuit breaker records the request in its rate window
+        if not self.rate_limiter.check_rate_limit():
+            return None
+
         # Check circuit breaker
         if not self.circuit_breaker.can_execute():
             logger.warning("SerpApi circuit breaker is open")
+            if not raise_on_open:
+                return None
             raise CircuitBreakerOpenError("SerpApi circuit breaker is open")
 
-        # Check rate limit
-        if not self.rate_limiter.check_rate_limit():
-            return None
-
         start_time = time.time()
 
         try:
-            response = requests.get(
-                self.BASE_URL,
-                params={**params, "api_key": self.api_key},
-                timeout=timeout
+            # send() skips Session.request's environment merge, so apply
+            # proxy/CA settings here to match a plain session.get()
+            response = self._session.send(
+                request,
+                timeout=timeout,
+                **self._session.merge_environment_settings(
+                    request.url, {}, None, None, None
+                )
             )
 
             latency_ms = (time.time() - start_time) * 1000
@@ -210,15 +593,14 @@ class SerpApiClient:
 
             # Handle rate limiting
             if response.status_code == 429:
-                retry_after = response.headers.get("Retry-After")
                 self.rate_limiter.handle_429(
-                    int(retry_after) if retry_after else None
+                    _parse_retry_after(response.headers.get("Retry-After"))
                 )
                 self.circuit_breaker.record_failure()
                 return None
 
             response.raise_for_status()
-            data = response.json()
+            data = _parse_json_response(response)
 
             # Check for API error in response
             if "error" in data:
@@ -230,7 +612,7 @@ class SerpApiClient:
                 return None
 
             self.circuit_breaker.record_success()
-            self.rate_limiter.reset()
+            self.rate_limiter.record_success()
             return data
 
         except requests.Timeout:
@@ -274,10 +656,9 @@ class SerpApiClient:
 
         # Default dates: 30 days out, 7 day trip
         if not departure_date:
-            departure_date = (datetime.now() + timedelta(days=30)).strftime("%Y-%m-%d")
+            departure_date = _default_departure_date(date.today().toordinal())
         if not return_date:
-            dep = datetime.strptime(departure_date, "%Y-%m-%d")
-            return_date = (dep + timedelta(days=7)).strftime("%Y-%m-%d")
+            return_date = _default_return_date(departure_date)
 
         params = {
             "engine": "google_flights",
@@ -288,51 +669,49 @@ class SerpApiClient:
             "currency": "TWD",
             "hl": "en",
         }
+        request = self._prepare_request(params)
 
-        # Retry wrapper
+        # Retry wrapper. An open circuit returns None instead of raising, so
+        # fast-fails during an outage skip exception construction.
         if TENACITY_AVAILABLE:
             @create_retry_decorator("serpapi")
             def fetch():
-                return self._make_request(params)
+                return self._make_request(request, raise_on_open=False)
 
             try:
                 data = fetch()
-            except RetryError:
+            except _tenacity().RetryError:
                 logger.error("SerpApi max retries exceeded")
                 return None
-            except CircuitBreakerOpenError:
-                return None
         else:
             try:
-                data = self._make_request(params)
-            except (requests.RequestException, CircuitBreakerOpenError):
+                data = self._make_request(request, raise_on_open=False)
+            except requests.RequestException:
                 return None
 
         if not data:
             return None
 
-        # Extract prices from best_flights or other_flights
-        prices = []
-
-        for flight in data.get("best_flights", []):
-            price = flight.get("price")
-            if price:
-                prices.append(float(price))
-
-        for flight in data.get("other_flights", []):
-            price = flight.get("price")
-            if price:
-                prices.append(float(price))
+        # Lowest price across best_flights and other_flights in one pass
+        min_price = min(
+            (
+                float(flight["price"])
+                for flight in chain(
+                    data.get("best_flights", ()),
+                    data.get("other_flights", ())
+                )
+                if flight.get("price")
+            ),
+            default=None
+        )
 
-        if not prices:
+        if min_price is None:
             logger.warning(
                 f"No prices found for {origin}-{destination}",
                 extra={"origin": origin, "destination": destination}
             )
             return None
 
-        min_price = min(prices)
-
         # Validate the price
         validation = validate_flight_cost(min_price, origin, destination)
         if not validation.is_valid:
@@ -362,65 +741,253 @@ class SerpApiClient:
 
         return result
 
+    def get_flight_prices_bulk(
+        self,
+        routes: List[Tuple[str, str]],
+        max_workers: int = 8
+    ) -> Dict[Tuple[str, str], Optional[DataWithProvenance]]:
+        """
+        Get flight prices for several routes concurrently.
+
+        Requests are I/O bound, so a small thread pool overlaps the network
+        waits. The shared rate limiter and circuit breaker still gate every
+        request. Only as many routes as the rate limiter can admit now are
+        looked up; the rest map to None so callers fall back to cached or
+        baseline prices, and later calls pick them up as the window refills.
+
+        Args:
+            routes: List of (origin, destination) airport code pairs
+            max_workers: Maximum concurrent requests
+
+        Returns:
+            Dictionary mapping each route to DataWithProvenance or None
+        """
+        unique_routes = list(dict.fromkeys(routes))
+        if not unique_routes:
+            return {}
+
+        # Submitting past the rate window would only fail at the limiter or
+        # the breaker, so defer the excess up front
+        budget = self.rate_limiter.available_requests()
+        if budget is not None and budget < len(unique_routes):
+            live_routes = unique_routes[:budget]
+            deferred_routes = unique_routes[budget:]
+        else:
+            live_routes = unique_routes
+            deferred_routes = []
+
+        results: Dict[Tuple[str, str], Optional[DataWithProvenance]] = dict.fromkeys(
+            deferred_routes
+        )
+        if deferred_routes:
+            logger.info(
+                f"Deferring {len(deferred_routes)} flight lookups to stay within the rate limit",
+                extra={
+                    "deferred_count": len(deferred_routes),
+                    "deferred_destinations": [destination for _, destination in deferred_routes],
+                }
+            )
+        if not live_routes:
+            return results
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(live_routes))) as executor:
+            futures = {
+                executor.submit(self.get_flight_price, origin, destination): (origin, destination)
+                for origin, destination in live_routes
+            }
+            for future in as_completed(futures):
+                route = futures[future]
+                try:
+                    results[route] = future.result()
+                except Exception as e:
+                    logger.error(
+                        f"Flight price lookup failed for {route[0]}-{route[1]}: {e}",
+                        extra={"origin": route[0], "destination": route[1]}
+                    )
+                    results[route] = None
+
+        missing = [route for route, result in results.items() if result is None]
+        if missing:
+            logger.warning(
+                f"No live flight price for {len(missing)} of {len(results)} routes",
+                extra={
+                    "missing_count": len(missing),
+                    "deferred_count": len(deferred_routes),
+                    "route_count": len(results),
+                    "missing_destinations": [destination for _, destination in missing],
+                }
+            )
+
+        return results
+
+
+@lru_cache(maxsize=1)
+def get_serpapi_client() -> SerpApiClient:
+    """
+    Get the process-wide SerpApi client.
+
+    Sharing one instance keeps circuit breaker and rate limiter state
+    consistent across callers.
+
+    Returns:
+        SerpApiClient instance
+    """
+    return SerpApiClient()
+
 
 # ============================================================================
 # ExchangeRate-API Client
 # ============================================================================
 
+@dataclass
+class _RatesCacheEntry:
+    """Raw rates for one base currency plus their lazily validated wrappers."""
+
+    stored_at: float  # time.monotonic() when stored
+    fetched_at: datetime
+    raw_rates: Dict[str, Any]
+    validated: Dict[str, Optional[DataWithProvenance]] = field(default_factory=dict)
+
+
+def _validate_and_wrap_rate(
+    currency: str,
+    rate: Any,
+    fetched_at: datetime
+) -> Optional[DataWithProvenance]:
+    """
+    Validate one API exchange rate and wrap it with provenance.
+
+    Args:
+        currency: Currency code
+        rate: Raw rate from the API
+        fetched_at: When the rates were fetched
+
+    Returns:
+        DataWithProvenance, or None if the rate is invalid
+    """
+    validation = validate_exchange_rate(rate, currency)
+
+    if not validation.is_valid:
+        logger.warning(
+            f"Invalid exchange rate for {currency}: {validation.errors}",
+            extra={"currency": currency, "rate": rate, "errors": validation.errors}
+        )
+        return None
+
+    result = DataWithProvenance.from_api(
+        value=validation.sanitized_value,
+        field_name=f"exchange_rate_{currency}",
+        quality_score=validation.confidence * 100,
+        fetched_at=fetched_at,
+    )
+    result.validation_warnings = validation.warnings
+    return result
+
+
+def _copy_rate(result: DataWithProvenance, is_stale: bool) -> DataWithProvenance:
+    """
+    Copy a validated rate wrapper for a caller.
+
+    Args:
+        result: Validated wrapper held in the in-memory rates cache
+        is_stale: Whether the cached rates are past their TTL
+
+    Returns:
+        Independent copy; stale rates are re-wrapped as STALE_CACHE data
+        with age-based quality
+    """
+    if is_stale:
+        stale = DataWithProvenance.from_cache(
+            value=result.value,
+            cached_at=result.fetched_at,
+            field_name=result.field_name,
+            is_stale=True,
+        )
+        stale.validation_warnings = list(result.validation_warnings)
+        return stale
+
+    return replace(result, validation_warnings=list(result.validation_warnings))
+
+
 class ExchangeRateClient:
     """Client for ExchangeRate-API with resilience features."""
 
     BASE_URL = "https://v6.exchangerate-api.com/v6"
+    API_KEY_ENV = "EXCHANGERATE_API_KEY"
 
     def __init__(self):
-        self.api_key = os.getenv("EXCHANGERATE_API_KEY", "")
         self.circuit_breaker = get_circuit_breaker("exchange_api")
-        self.rate_limiter = RateLimitHandler("exchange_api")
+        self.rate_limiter = RateLimitHandler.for_circuit_breaker(
+            "exchange_api", self.circuit_breaker
+        )
+        self._session = _create_session()
+
+        # In-memory rates per base currency
+        self._rates_cache: Dict[str, _RatesCacheEntry] = {}
+        self._rates_ttl_seconds = CACHE_TTL["exchange"] * 3600
+
+    @property
+    def api_key(self) -> str:
+        """API key, re-read from the environment until one is set."""
+        return _api_key(self.API_KEY_ENV)
 
     @property
     def is_configured(self) -> bool:
         """Check if API key is configured."""
         return bool(self.api_key)
 
-    def _make_request(self, url: str, timeout: int = 10) -> Optional[Dict[str, Any]]:
+    def close(self) -> None:
+        """Close pooled HTTP connections."""
+        self._session.close()
+
+    def _make_request(
+        self,
+        url: str,
+        timeout: int = 10,
+        raise_on_open: bool = True
+    ) -> Optional[Dict[str, Any]]:
         """
         Make HTTP request with error handling.
 
         Args:
             url: Full request URL
             timeout: Request timeout
+            raise_on_open: Raise CircuitBreakerOpenError when the circuit is
+                open; if False, return None without building an exception
 
         Returns:
             JSON response or None
         """
+        # Check rate limit first: waiting for a token happens here, before
+        # the circuit breaker records the request in its rate window
+        if not self.rate_limiter.check_rate_limit():
+            return None
+
         # Check circuit breaker
         if not self.circuit_breaker.can_execute():
             logger.warning("ExchangeRate API circuit breaker is open")
+            if not raise_on_open:
+                return None
             raise CircuitBreakerOpenError("ExchangeRate API circuit breaker is open")
 
-        # Check rate limit
-        if not self.rate_limiter.check_rate_limit():
-            return None
-
         start_time = time.time()
 
         try:
-            response = requests.get(url, timeout=timeout)
+            response = self._session.get(url, timeout=timeout)
 
             latency_ms = (time.time() - start_time) * 1000
             metrics.record_api_latency("exchange_api", latency_ms)
 
             # Handle rate limiting
             if response.status_code == 429:
-                retry_after = response.headers.get("Retry-After")
                 self.rate_limiter.handle_429(
-                    int(retry_after) if retry_after else None
+                    _parse_retry_after(response.headers.get("Retry-After"))
                 )
                 self.circuit_breaker.record_failure()
                 return None
 
             response.raise_for_status()
-            data = response.json()
+            data = _parse_json_response(response)
 
             if data.get("result") != "success":
                 logger.error(
@@ -431,7 +998,7 @@ class ExchangeRateClient:
                 return None
 
             self.circuit_breaker.record_success()
-            self.rate_limiter.reset()
+            self.rate_limiter.record_success()
             return data
 
         except requests.Timeout:
@@ -449,40 +1016,115 @@ class ExchangeRateClient:
             metrics.record_error("request_error")
             raise
 
-    @log_api_call("exchange_api")
-    def get_rates(self, base_currency: str = "TWD") -> Optional[Dict[str, DataWithProvenance]]:
+    def get_rates(
+        self,
+        base_currency: str = "TWD",
+        needed: Optional[Set[str]] = None
+    ) -> Optional[Dict[str, DataWithProvenance]]:
         """
         Get exchange rates with TWD as base.
 
+        Raw rates are held in memory within the exchange cache TTL. If a
+        refresh fails, rates up to STALE_TTL_MULTIPLIER x TTL old are used
+        instead (stale-while-revalidate) and returned as STALE_CACHE data.
+        Each currency is validated only the first time it is requested;
+        callers always get their own copy of the wrapper.
+
         Args:
             base_currency: Base currency code
+            needed: Optional currency codes to return; all if None
 
         Returns:
             Dictionary of currency code to DataWithProvenance, or None
         """
+        entry = self._get_rates_entry(base_currency)
+        if entry is None:
+            return None
+
+        raw_rates = entry.raw_rates
+        currencies = raw_rates if needed is None else [c for c in needed if c in raw_rates]
+        is_stale = time.monotonic() - entry.stored_at >= self._rates_ttl_seconds
+
+        validated_rates = {}
+        for currency in currencies:
+            if currency not in entry.validated:
+                entry.validated[currency] = _validate_and_wrap_rate(
+                    currency, raw_rates[currency], entry.fetched_at
+                )
+            result = entry.validated[currency]
+            if result is not None:
+                validated_rates[currency] = _copy_rate(result, is_stale)
+
+        return validated_rates
+
+    def _get_rates_entry(self, base_currency: str) -> Optional["_RatesCacheEntry"]:
+        """
+        Get the in-memory rates entry for a base currency, refreshing if expired.
+
+        Args:
+            base_currency: Base currency code
+
+        Returns:
+            Cache entry, or None if unavailable
+        """
         if not self.is_configured:
             logger.debug("ExchangeRate API not configured, skipping")
             return None
 
+        cached = self._rates_cache.get(base_currency)
+        if cached and time.monotonic() - cached.stored_at < self._rates_ttl_seconds:
+            return cached
+
+        raw_rates = self._fetch_rates(base_currency)
+        if raw_rates:
+            entry = _RatesCacheEntry(
+                stored_at=time.monotonic(),
+                fetched_at=datetime.now(),
+                raw_rates=raw_rates,
+            )
+            self._rates_cache[base_currency] = entry
+            return entry
+
+        if cached:
+            age_seconds = time.monotonic() - cached.stored_at
+            if age_seconds < self._rates_ttl_seconds * STALE_TTL_MULTIPLIER:
+                logger.warning(
+                    f"Serving stale exchange rates for {base_currency}",
+                    extra={"age_seconds": round(age_seconds)}
+                )
+                return cached
+
+        return None
+
+    @log_api_call("exchange_api")
+    def _fetch_rates(self, base_currency: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch raw exchange rates from the API.
+
+        Args:
+            base_currency: Base currency code
+
+        Returns:
+            Dictionary of currency code to raw rate, or None
+        """
         url = f"{self.BASE_URL}/{self.api_key}/latest/{base_currency}"
 
-        # Retry wrapper
+        # Retry wrapper. An open circuit returns None instead of raising, so
+        # fast-fails during an outage skip exception construction.
         if TENACITY_AVAILABLE:
             @create_retry_decorator("exchange_api")
             def fetch():
-                return self._make_request(url)
+                return self._make_request(url, raise_on_open=False)
 
             try:
                 data = fetch()
-            except RetryError:
+            except _tenacity().RetryError:
                 logger.error("ExchangeRate API max retries exceeded")
                 return None
-            except CircuitBreakerOpenError:
-                return None
         else:
             try:
-                data = self._make_request(url)
-            except (requests.RequestException, CircuitBreakerOpenError):
+                data = self._make_request(url, raise_on_open=False)
+            except requests.RequestException:
                 return None
 
         if not data:
@@ -492,31 +1134,12 @@ class ExchangeRateClient:
         if not raw_rates:
             return None
 
-        # Validate and wrap with provenance
-        validated_rates = {}
-        for currency, rate in raw_rates.items():
-            validation = validate_exchange_rate(rate, currency)
-
-            if validation.is_valid:
-                result = DataWithProvenance.from_api(
-                    value=validation.sanitized_value,
-                    field_name=f"exchange_rate_{currency}",
-                    quality_score=validation.confidence * 100
-                )
-                result.validation_warnings = validation.warnings
-                validated_rates[currency] = result
-            else:
-                logger.warning(
-                    f"Invalid exchange rate for {currency}: {validation.errors}",
-                    extra={"currency": currency, "rate": rate, "errors": validation.errors}
-                )
-
         logger.info(
-            f"Exchange rates retrieved: {len(validated_rates)} currencies",
-            extra={"currency_count": len(validated_rates)}
+            f"Exchange rates retrieved: {len(raw_rates)} currencies",
+            extra={"currency_count": len(raw_rates)}
         )
 
-        return validated_rates
+        return raw_rates
 
     @log_api_call("exchange_api")
     def get_rate(
@@ -527,6 +1150,8 @@ class ExchangeRateClient:
         """
         Get single exchange rate.
 
+        Only the target currency is validated.
+
         Args:
             target_currency: Target currency code
             base_currency: Base currency code
@@ -534,12 +1159,66 @@ class ExchangeRateClient:
         Returns:
             DataWithProvenance with rate or None
         """
-        rates = self.get_rates(base_currency)
+        rates = self.get_rates(base_currency, needed={target_currency})
         if rates:
             return rates.get(target_currency)
         return None
 
 
+@lru_cache(maxsize=1)
+def get_exchange_client() -> ExchangeRateClient:
+    """
+    Get the process-wide ExchangeRate-API client.
+
+    Sharing one instance keeps circuit breaker and rate limiter state
+    consistent across callers.
+
+    Returns:
+        ExchangeRateClient instance
+    """
+    return ExchangeRateClient()
+
+
+# ============================================================================
+# Data File Loading
+# ============================================================================
+
+@lru_cache(maxsize=8)
+def _load_json_cached(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a JSON data file; mtime_ns is part of the key so edits invalidate it."""
+    with open(path_str, "rb") as f:
+        return _json_loads(f.read())
+
+
+def _load_json(path: Path) -> Dict[str, Any]:
+    """
+    Load a bundled JSON data file, re-parsing only when it changes on disk.
+
+    The returned dictionary is shared between callers and must not be mutated.
+
+    Args:
+        path: Path to JSON file
+
+    Returns:
+        Parsed JSON content
+    """
+    return _load_json_cached(str(path), path.stat().st_mtime_ns)
+
+
+def clear_data_caches() -> None:
+    """
+    Drop parsed data files and derived indexes.
+
+    Lookups already re-parse when a file's mtime changes, and misses are
+    plain dict lookups, so this is only needed when a file is replaced
+    without its mtime changing (e.g. restored with preserved timestamps).
+    Memoized cache file parses are dropped as well.
+    """
+    _load_json_cached.cache_clear()
+    _col_by_country.cache_clear()
+    clear_parsed_cache()
+
+
 # ============================================================================
 # Cost of Living Data Functions
 # ============================================================================
@@ -552,13 +1231,23 @@ def get_col_data() -> Dict[str, Any]:
         Dictionary with city CoL data
     """
     try:
-        with open(COL_DATA_PATH, "r") as f:
-            return json.load(f)
+        return _load_json(COL_DATA_PATH)
     except (IOError, json.JSONDecodeError) as e:
         logger.error(f"Error loading CoL data: {e}")
         return {"cities": {}}
 
 
+@lru_cache(maxsize=1)
+def _col_by_country(path_str: str, mtime_ns: int) -> Dict[str, Optional[float]]:
+    """Index CoL data by country; the first listed city wins, matching the old scan."""
+    index: Dict[str, Optional[float]] = {}
+    for city_data in _load_json_cached(path_str, mtime_ns).get("cities", {}).values():
+        country = city_data.get("country")
+        if country is not None:
+            index.setdefault(country, city_data.get("monthly_cost_usd"))
+    return index
+
+
 def get_col_for_country(country_name: str) -> Optional[float]:
     """
     Get monthly cost of living for a country's capital city.
@@ -569,15 +1258,13 @@ def get_col_for_country(country_name: str) -> Optional[float]:
     Returns:
         Monthly cost in USD or None
     """
-    col_data = get_col_data()
-    cities = col_data.get("cities", {})
-
-    # Find city matching country
-    for city_name, city_data in cities.items():
-        if city_data.get("country") == country_name:
-            return city_data.get("monthly_cost_usd")
+    try:
+        index = _col_by_country(str(COL_DATA_PATH), COL_DATA_PATH.stat().st_mtime_ns)
+    except (IOError, json.JSONDecodeError) as e:
+        logger.error(f"Error loading CoL data: {e}")
+        return None
 
-    return None
+    return index.get(country_name)
 
 
 # ============================================================================
@@ -592,8 +1279,7 @@ def load_countries() -> Dict[str, Any]:
         Country configuration dictionary
     """
     try:
-        with open(COUNTRIES_PATH, "r") as f:
-            return json.load(f)
+        return _load_json(COUNTRIES_PATH)
     except (IOError, json.JSONDecodeError) as e:
         logger.error(f"Error loading countries data: {e}")
         return {"origin": {}, "destinations": {}}
@@ -607,8 +1293,7 @@ def load_baselines_v2() -> Dict[str, Any]:
         Baselines v2 dictionary with provenance
     """
     try:
-        with open(BASELINES_V2_PATH, "r") as f:
-            return json.load(f)
+        return _load_json(BASELINES_V2_PATH)
     except (IOError, json.JSONDecodeError) as e:
         logger.warning(f"Error loading baselines_v2 data: {e}, falling back to countries.json")
         return {}
@@ -695,6 +1380,39 @@ def get_baseline_data(country_key: str) -> Dict[str, DataWithProvenance]:
     return {}
 
 
+def _get_baseline_value(
+    country_key: str,
+    field_name: str,
+    default: float
+) -> Optional[float]:
+    """
+    Read a single raw baseline value without building provenance wrappers.
+
+    Follows the same lookup order as get_baseline_data: baselines_v2 first,
+    then the legacy countries.json baseline block.
+
+    Args:
+        country_key: Country key from countries.json
+        field_name: Baseline field ('exchange_rate', 'flight_cost_twd', 'monthly_col_usd')
+        default: Value used when the legacy baseline block lacks the field
+
+    Returns:
+        Baseline value or None
+    """
+    baselines = load_baselines_v2().get("baselines", {})
+    if country_key in baselines:
+        baseline = baselines[country_key]
+        if field_name in baseline:
+            return baseline[field_name]["value"]
+        return None
+
+    destination = load_countries().get("destinations", {}).get(country_key)
+    if destination:
+        return destination.get("baseline", {}).get(field_name, default)
+
+    return None
+
+
 def get_mock_flight_cost(country_key: str) -> Optional[float]:
     """
     Get mock/baseline flight cost for a country.
@@ -705,10 +1423,7 @@ def get_mock_flight_cost(country_key: str) -> Optional[float]:
     Returns:
         Mock flight cost in TWD or None
     """
-    baseline_data = get_baseline_data(country_key)
-    if "flight_cost" in baseline_data:
-        return baseline_data["flight_cost"].value
-    return None
+    return _get_baseline_value(country_key, "flight_cost_twd", 10000)
 
 
 def get_mock_exchange_rate(country_key: str) -> Optional[float]:
@@ -721,7 +1436,4 @@ def get_mock_exchange_rate(country_key: str) -> Optional[float]:
     Returns:
         Mock exchange rate (TWD to foreign) or None
     """
-    baseline_data = get_baseline_data(country_key)
-    if "exchange_rate" in baseline_data:
-        return baseline_data["exchange_rate"].value
-    return None
+    return _get_baseline_value(country_key, "exchange_rate", 1.0)
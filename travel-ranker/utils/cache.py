@@ -11,14 +11,26 @@ Enhanced with:
 
 import hashlib
 import json
+import logging
+import mmap
 import os
+import threading
+import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from utils.logging_config import get_logger, metrics
 from utils.data_quality import DataSource
 
+# orjson is optional; stdlib json is the fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Logger
 logger = get_logger("cache")
 
@@ -41,6 +53,13 @@ CACHE_VERSION = "1.1"
 # Maximum cache size in bytes (100 MB)
 MAX_CACHE_SIZE_BYTES = 100 * 1024 * 1024
 
+# Cache files larger than this are parsed from an mmap when orjson is available
+MMAP_THRESHOLD_BYTES = 128 * 1024
+
+# Parsed cache files are memoized only up to this size, and only this many
+PARSED_CACHE_MAX_BYTES = MMAP_THRESHOLD_BYTES
+PARSED_CACHE_MAX_ENTRIES = 32
+
 
 # ============================================================================
 # Cache Path Management
@@ -67,6 +86,94 @@ def get_cache_path(cache_type: str, key: str = "") -> Path:
     return CACHE_DIR / filename
 
 
+# ============================================================================
+# Cache File Reading
+# ============================================================================
+
+def _load_cache_file(path_str: str, size: int) -> Dict[str, Any]:
+    """Parse a cache file from disk, without memoization."""
+    if ORJSON_AVAILABLE and size > MMAP_THRESHOLD_BYTES:
+        # orjson parses straight from the mapped pages, skipping the bytes copy
+        with open(path_str, "rb") as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+                memoryview(mapped) as view:
+            return orjson.loads(view)
+
+    # Whole-file read: one read() sized from fstat, so buffer size is moot
+    raw = Path(path_str).read_bytes()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@lru_cache(maxsize=PARSED_CACHE_MAX_ENTRIES)
+def _parse_cache_file_cached(path_str: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Memoized _load_cache_file; mtime_ns and size are part of the key so rewrites invalidate it."""
+    return _load_cache_file(path_str, size)
+
+
+def _parse_cache_file(path_str: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse a cache file, memoizing small files per on-disk version.
+
+    Files over PARSED_CACHE_MAX_BYTES are parsed on every call, so the
+    memo never pins large payloads in memory.
+    """
+    if size > PARSED_CACHE_MAX_BYTES:
+        return _load_cache_file(path_str, size)
+    return _parse_cache_file_cached(path_str, mtime_ns, size)
+
+
+def clear_parsed_cache() -> None:
+    """
+    Drop memoized cache file parses and checksum results.
+
+    Entries are keyed on (path, mtime_ns, size), so a rewrite with the same
+    size inside the filesystem's mtime granularity would otherwise be
+    served from the old parse. Called after every cache write or delete.
+    """
+    _parse_cache_file_cached.cache_clear()
+    _verify_cache_file.cache_clear()
+
+
+def _read_cache_file(cache_path: Path) -> Dict[str, Any]:
+    """
+    Read a cache file, re-parsing only when it changes on disk.
+
+    Uses orjson when installed. For small files the returned dictionary is
+    shared between callers and must not be mutated.
+
+    Args:
+        cache_path: Path to cache file
+
+    Returns:
+        Parsed cache data
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON (orjson's error
+            is a subclass)
+        IOError: If the file cannot be read, including FileNotFoundError
+    """
+    return _parse_cache_file(*_cache_file_key(cache_path))
+
+
+def _cache_file_key(cache_path: Path) -> Tuple[str, int, int]:
+    """Identify the on-disk version of a cache file as (path, mtime_ns, size)."""
+    stat = cache_path.stat()
+    return str(cache_path), stat.st_mtime_ns, stat.st_size
+
+
+@lru_cache(maxsize=256)
+def _verify_cache_file(path_str: str, mtime_ns: int, size: int) -> bool:
+    """
+    Verify a cache file's checksum once per on-disk version.
+
+    Repeated validity and health checks of an unchanged file then cost a
+    stat() rather than a full re-serialize and hash of its contents.
+    """
+    return verify_checksum(_parse_cache_file(path_str, mtime_ns, size))
+
+
 # ============================================================================
 # Checksum Functions
 # ============================================================================
@@ -81,12 +188,16 @@ def calculate_checksum(data: Dict[str, Any]) -> str:
     Returns:
         Hex digest of SHA-256 hash
     """
-    # Remove metadata fields for checksum calculation
+    # Remove metadata fields for checksum calculation (k[:1] skips a method
+    # call per key and is safe for empty keys)
     data_for_hash = {
         k: v for k, v in data.items()
-        if not k.startswith("_")
+        if k[:1] != "_"
     }
+    # Stays on stdlib json: stored checksums depend on this exact output
     json_str = json.dumps(data_for_hash, sort_keys=True, default=str)
+    # hashlib.sha256 is bound directly to OpenSSL's implementation, which
+    # selects SHA-NI at runtime on CPUs that have it
     return hashlib.sha256(json_str.encode()).hexdigest()[:16]
 
 
@@ -113,35 +224,72 @@ def verify_checksum(data: Dict[str, Any]) -> bool:
 # Cache Validation
 # ============================================================================
 
-def is_cache_valid(cache_path: Path, cache_type: str) -> bool:
+def _cache_age_seconds(data: Dict[str, Any]) -> Optional[float]:
     """
-    Check if cache file exists and is within TTL.
+    Get the age of parsed cache data in seconds.
+
+    Uses the numeric _timestamp_unix field when present, falling back to
+    parsing the ISO _timestamp written by older versions.
 
     Args:
-        cache_path: Path to cache file
-        cache_type: Type of cache for TTL lookup
+        data: Parsed cache file contents
 
     Returns:
-        True if cache is valid, False otherwise
+        Age in seconds, or None if there is no timestamp
+
+    Raises:
+        ValueError: If only an unparseable ISO timestamp is present
     """
-    if not cache_path.exists():
-        return False
+    timestamp_unix = data.get("_timestamp_unix")
+    if timestamp_unix is not None:
+        return time.time() - timestamp_unix
 
-    try:
-        with open(cache_path, "r") as f:
-            data = json.load(f)
-
-        # Check version compatibility
-        version = data.get("_version")
-        if version and version != CACHE_VERSION:
-            logger.info(
-                f"Cache version mismatch: {version} != {CACHE_VERSION}",
-                extra={"cache_path": str(cache_path)}
-            )
-            return False
+    timestamp_str = data.get("_timestamp")
+    if not timestamp_str:
+        return None
+
+    return (datetime.now() - datetime.fromisoformat(timestamp_str)).total_seconds()
+
+
+def _validate_parsed(
+    cache_path: Path,
+    data: Dict[str, Any],
+    checksum_ok: bool,
+    cache_type: str,
+    invalidate_corrupted: bool = True
+) -> Tuple[bool, bool, Optional[int]]:
+    """
+    Evaluate an already-parsed cache file in one pass.
+
+    Version mismatches are logged and never valid. A checksum failure only
+    counts as corruption, and deletes the file, for current-version files:
+    an outdated file is left in place, as before.
+
+    Args:
+        cache_path: Path to cache file
+        data: Parsed cache file contents
+        checksum_ok: Result of verifying the file's checksum
+        cache_type: Type of cache for TTL lookup
+        invalidate_corrupted: Delete a corrupted current-version file;
+            False for read-only checks such as is_cache_stale_but_usable
 
-        # Check checksum
-        if not verify_checksum(data):
+    Returns:
+        Tuple of (is_valid, is_stale, age_seconds). is_stale means past TTL
+        but within the stale window; age_seconds is None without a
+        parseable timestamp.
+    """
+    # Check version compatibility
+    version = data.get("_version")
+    version_ok = not version or version == CACHE_VERSION
+    if not version_ok:
+        logger.info(
+            f"Cache version mismatch: {version} != {CACHE_VERSION}",
+            extra={"cache_path": str(cache_path)}
+        )
+
+    # Check checksum
+    if not checksum_ok:
+        if version_ok and invalidate_corrupted:
             logger.warning(
                 f"Cache corruption detected: {cache_path}",
                 extra={"cache_path": str(cache_path)}
@@ -149,23 +297,49 @@ def is_cache_valid(cache_path: Path, cache_type: str) -> bool:
             metrics.record_error("cache_corruption")
             # Auto-invalidate corrupted cache
             invalidate_cache(cache_path)
-            return False
+        return False, False, None
+
+    # Check timestamp
+    try:
+        age_seconds = _cache_age_seconds(data)
+    except ValueError as e:
+        logger.warning(f"Cache validation error: {e}")
+        return False, False, None
+
+    if age_seconds is None:
+        return False, False, None
+
+    ttl_seconds = CACHE_TTL.get(cache_type, 24) * 3600
+
+    # Within TTL is valid; past TTL but within STALE_TTL_MULTIPLIER x TTL is stale
+    is_valid = version_ok and age_seconds < ttl_seconds
+    is_stale = ttl_seconds <= age_seconds < ttl_seconds * STALE_TTL_MULTIPLIER
+
+    return is_valid, is_stale, int(age_seconds)
 
-        # Check timestamp
-        timestamp_str = data.get("_timestamp")
-        if not timestamp_str:
-            return False
 
-        cached_time = datetime.fromisoformat(timestamp_str)
-        ttl_hours = CACHE_TTL.get(cache_type, 24)
-        expiry_time = cached_time + timedelta(hours=ttl_hours)
+def is_cache_valid(cache_path: Path, cache_type: str) -> bool:
+    """
+    Check if cache file exists and is within TTL.
 
-        return datetime.now() < expiry_time
+    Args:
+        cache_path: Path to cache file
+        cache_type: Type of cache for TTL lookup
 
-    except (json.JSONDecodeError, ValueError, KeyError) as e:
+    Returns:
+        True if cache is valid, False otherwise
+    """
+    try:
+        file_key = _cache_file_key(cache_path)
+        data = _parse_cache_file(*file_key)
+    except FileNotFoundError:
+        return False
+    except json.JSONDecodeError as e:
         logger.warning(f"Cache validation error: {e}")
         return False
 
+    return _validate_parsed(cache_path, data, _verify_cache_file(*file_key), cache_type)[0]
+
 
 def is_cache_stale_but_usable(cache_path: Path, cache_type: str) -> bool:
     """
@@ -180,38 +354,17 @@ def is_cache_stale_but_usable(cache_path: Path, cache_type: str) -> bool:
     Returns:
         True if cache is stale but usable, False otherwise
     """
-    if not cache_path.exists():
-        return False
-
     try:
-        with open(cache_path, "r") as f:
-            data = json.load(f)
-
-        # Check checksum first
-        if not verify_checksum(data):
-            return False
-
-        timestamp_str = data.get("_timestamp")
-        if not timestamp_str:
-            return False
-
-        cached_time = datetime.fromisoformat(timestamp_str)
-        ttl_hours = CACHE_TTL.get(cache_type, 24)
-
-        # Normal expiry
-        expiry_time = cached_time + timedelta(hours=ttl_hours)
-
-        # Stale expiry (2x TTL)
-        stale_expiry = cached_time + timedelta(hours=ttl_hours * STALE_TTL_MULTIPLIER)
-
-        now = datetime.now()
-
-        # Past normal TTL but within stale window
-        return expiry_time <= now < stale_expiry
-
-    except (json.JSONDecodeError, ValueError, KeyError):
+        file_key = _cache_file_key(cache_path)
+        data = _parse_cache_file(*file_key)
+    except (FileNotFoundError, json.JSONDecodeError):
         return False
 
+    return _validate_parsed(
+        cache_path, data, _verify_cache_file(*file_key), cache_type,
+        invalidate_corrupted=False
+    )[1]
+
 
 def invalidate_cache(cache_path: Path) -> bool:
     """
@@ -226,6 +379,7 @@ def invalidate_cache(cache_path: Path) -> bool:
     try:
         if cache_path.exists():
             cache_path.unlink()
+            clear_parsed_cache()
             logger.info(f"Invalidated cache: {cache_path}")
             return True
     except IOError as e:
@@ -260,17 +414,17 @@ def fetch_cached_data(
     # Check fresh cache first
     if is_cache_valid(cache_path, cache_type):
         try:
-            with open(cache_path, "r") as f:
-                data = json.load(f)
+            data = _read_cache_file(cache_path)
 
             # Return data without metadata
             result = {k: v for k, v in data.items() if not k.startswith("_")}
 
             metrics.record_cache_hit()
-            logger.debug(
-                f"Cache hit: {cache_type}/{key}",
-                extra={"cache_type": cache_type, "key": key}
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"Cache hit: {cache_type}/{key}",
+                    extra={"cache_type": cache_type, "key": key}
+                )
             return result, DataSource.CACHE
 
         except (json.JSONDecodeError, IOError):
@@ -279,8 +433,7 @@ def fetch_cached_data(
     # Check stale cache if allowed
     if allow_stale and is_cache_stale_but_usable(cache_path, cache_type):
         try:
-            with open(cache_path, "r") as f:
-                data = json.load(f)
+            data = _read_cache_file(cache_path)
 
             result = {k: v for k, v in data.items() if not k.startswith("_")}
 
@@ -294,27 +447,67 @@ def fetch_cached_data(
             pass
 
     metrics.record_cache_miss()
-    logger.debug(
-        f"Cache miss: {cache_type}/{key}",
-        extra={"cache_type": cache_type, "key": key}
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"Cache miss: {cache_type}/{key}",
+            extra={"cache_type": cache_type, "key": key}
+        )
     return default, DataSource.MOCK
 
 
+def _atomic_write(cache_path: Path, payload: bytes, durable: bool = False) -> None:
+    """
+    Write a file via a temporary sibling and os.replace.
+
+    The temporary name ends in .tmp, so cache directory scans for *.json
+    never pick it up.
+
+    Args:
+        cache_path: Final file path
+        payload: File contents
+        durable: If True, fsync before renaming
+
+    Raises:
+        IOError: If the write or rename fails; the temporary file is removed
+    """
+    # Unique per process and thread, and created with normal umask permissions
+    tmp_path = cache_path.with_name(
+        f".{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 def save_cache(
     cache_type: str,
     data: Any,
     key: str = "",
-    schema: Optional[str] = None
+    schema: Optional[str] = None,
+    durable: bool = False
 ) -> bool:
     """
     Save data to cache with timestamp and checksum.
 
+    The file is written to a temporary name and renamed into place, so
+    readers never see a partially written cache.
+
     Args:
         cache_type: Type of cache ('flights', 'exchange', 'col')
         data: Data to cache
         key: Optional key for specific cache entry
         schema: Optional schema identifier
+        durable: If True, fsync the file before the rename
 
     Returns:
         True if save successful, False otherwise
@@ -330,6 +523,7 @@ def save_cache(
             "_version": CACHE_VERSION,
             "_schema": schema or f"{cache_type}_v1",
             "_timestamp": datetime.now().isoformat(),
+            "_timestamp_unix": time.time(),
             "_cache_type": cache_type,
             "_checksum": checksum,
             **data
@@ -337,13 +531,19 @@ def save_cache(
 
         CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
-        with open(cache_path, "w") as f:
-            json.dump(cache_data, f, indent=2, default=str)
+        # Written with stdlib json: the stored checksum was computed from
+        # json.dumps(default=str) output, and orjson renders datetimes,
+        # numpy scalars and dataclasses differently. Compact separators keep
+        # files small; older indented files still read fine.
+        payload = json.dumps(cache_data, separators=(",", ":"), default=str)
+        _atomic_write(cache_path, payload.encode(), durable)
+        clear_parsed_cache()
 
-        logger.debug(
-            f"Cache saved: {cache_type}/{key}",
-            extra={"cache_type": cache_type, "key": key}
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Cache saved: {cache_type}/{key}",
+                extra={"cache_type": cache_type, "key": key}
+            )
         return True
 
     except (IOError, TypeError) as e:
@@ -372,15 +572,11 @@ def get_cache_age(cache_type: str, key: str = "") -> Optional[str]:
         return None
 
     try:
-        with open(cache_path, "r") as f:
-            data = json.load(f)
-
-        timestamp_str = data.get("_timestamp")
-        if not timestamp_str:
+        age_seconds = _cache_age_seconds(_read_cache_file(cache_path))
+        if age_seconds is None:
             return None
 
-        cached_time = datetime.fromisoformat(timestamp_str)
-        age = datetime.now() - cached_time
+        age = timedelta(seconds=age_seconds)
 
         if age.days > 0:
             return f"{age.days} day(s) ago"
@@ -414,16 +610,11 @@ def get_cache_age_seconds(cache_type: str, key: str = "") -> Optional[int]:
         return None
 
     try:
-        with open(cache_path, "r") as f:
-            data = json.load(f)
-
-        timestamp_str = data.get("_timestamp")
-        if not timestamp_str:
+        age_seconds = _cache_age_seconds(_read_cache_file(cache_path))
+        if age_seconds is None:
             return None
 
-        cached_time = datetime.fromisoformat(timestamp_str)
-        age = datetime.now() - cached_time
-        return int(age.total_seconds())
+        return int(age_seconds)
 
     except (json.JSONDecodeError, ValueError, IOError):
         return None
@@ -442,34 +633,49 @@ def get_cache_info(cache_type: str, key: str = "") -> Optional[Dict[str, Any]]:
     """
     cache_path = get_cache_path(cache_type, key)
 
-    if not cache_path.exists():
-        return None
-
     try:
-        with open(cache_path, "r") as f:
-            data = json.load(f)
-
-        file_stat = cache_path.stat()
-
-        return {
-            "version": data.get("_version"),
-            "schema": data.get("_schema"),
-            "timestamp": data.get("_timestamp"),
-            "checksum": data.get("_checksum"),
-            "file_size_bytes": file_stat.st_size,
-            "is_valid": is_cache_valid(cache_path, cache_type),
-            "is_stale": is_cache_stale_but_usable(cache_path, cache_type),
-            "age_seconds": get_cache_age_seconds(cache_type, key),
-        }
-
+        file_key = _cache_file_key(cache_path)
+        data = _parse_cache_file(*file_key)
     except (json.JSONDecodeError, IOError):
         return None
 
+    is_valid, is_stale, age_seconds = _validate_parsed(
+        cache_path, data, _verify_cache_file(*file_key), cache_type
+    )
+
+    return {
+        "version": data.get("_version"),
+        "schema": data.get("_schema"),
+        "timestamp": data.get("_timestamp"),
+        "checksum": data.get("_checksum"),
+        "file_size_bytes": file_key[2],
+        "is_valid": is_valid,
+        "is_stale": is_stale,
+        "age_seconds": age_seconds,
+    }
+
 
 # ============================================================================
 # Cache Management
 # ============================================================================
 
+def _scan_cache_files() -> List[os.DirEntry]:
+    """
+    List cache files with os.scandir.
+
+    DirEntry objects memoize their stat() result, and no Path objects are
+    built per file.
+
+    Returns:
+        Directory entries for *.json files, empty if the directory is missing
+    """
+    try:
+        with os.scandir(CACHE_DIR) as it:
+            return [entry for entry in it if entry.name.endswith(".json")]
+    except FileNotFoundError:
+        return []
+
+
 def clear_cache(cache_type: Optional[str] = None) -> int:
     """
     Clear cache files.
@@ -482,17 +688,15 @@ def clear_cache(cache_type: Optional[str] = None) -> int:
     """
     deleted = 0
 
-    if not CACHE_DIR.exists():
-        return 0
-
-    for cache_file in CACHE_DIR.glob("*.json"):
-        if cache_type is None or cache_file.name.startswith(cache_type):
+    for entry in _scan_cache_files():
+        if cache_type is None or entry.name.startswith(cache_type):
             try:
-                cache_file.unlink()
+                os.unlink(entry.path)
                 deleted += 1
             except IOError:
                 pass
 
+    clear_parsed_cache()
     logger.info(f"Cleared {deleted} cache files")
     return deleted
 
@@ -504,13 +708,10 @@ def get_cache_size() -> int:
     Returns:
         Total size in bytes
     """
-    if not CACHE_DIR.exists():
-        return 0
-
     total_size = 0
-    for cache_file in CACHE_DIR.glob("*.json"):
+    for entry in _scan_cache_files():
         try:
-            total_size += cache_file.stat().st_size
+            total_size += entry.stat().st_size
         except IOError:
             pass
 
@@ -524,24 +725,24 @@ def get_cache_files() -> List[Dict[str, Any]]:
     Returns:
         List of cache file info dictionaries
     """
-    if not CACHE_DIR.exists():
-        return []
-
-    files = []
-    for cache_file in CACHE_DIR.glob("*.json"):
+    stats = []
+    for entry in _scan_cache_files():
         try:
-            stat = cache_file.stat()
-            files.append({
-                "name": cache_file.name,
-                "size_bytes": stat.st_size,
-                "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-            })
+            stats.append((entry.name, entry.stat()))
         except IOError:
             pass
 
     # Sort by modification time, newest first
-    files.sort(key=lambda x: x["modified"], reverse=True)
-    return files
+    stats.sort(key=lambda item: item[1].st_mtime_ns, reverse=True)
+
+    return [
+        {
+            "name": name,
+            "size_bytes": stat.st_size,
+            "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+        }
+        for name, stat in stats
+    ]
 
 
 def evict_lru_caches(target_size: int = MAX_CACHE_SIZE_BYTES) -> int:
@@ -554,29 +755,36 @@ def evict_lru_caches(target_size: int = MAX_CACHE_SIZE_BYTES) -> int:
     Returns:
         Number of files evicted
     """
-    current_size = get_cache_size()
+    # Single directory pass for both the size total and the LRU order
+    entries = []
+    for entry in _scan_cache_files():
+        try:
+            stat = entry.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime_ns, stat.st_size, entry.path, entry.name))
+
+    current_size = sum(size for _, size, _, _ in entries)
     if current_size <= target_size:
         return 0
 
-    files = get_cache_files()
-    # Sort by modification time, oldest first (for LRU eviction)
-    files.sort(key=lambda x: x["modified"])
+    # Oldest modification time first (for LRU eviction)
+    entries.sort()
 
     evicted = 0
-    for file_info in files:
+    for _, file_size, path, name in entries:
         if current_size <= target_size:
             break
 
-        cache_path = CACHE_DIR / file_info["name"]
         try:
-            file_size = file_info["size_bytes"]
-            cache_path.unlink()
+            os.unlink(path)
             current_size -= file_size
             evicted += 1
-            logger.info(f"Evicted LRU cache: {file_info['name']}")
+            logger.info(f"Evicted LRU cache: {name}")
         except IOError:
             pass
 
+    clear_parsed_cache()
     return evicted
 
 
@@ -604,28 +812,48 @@ def check_cache_health() -> Dict[str, Any]:
     Returns:
         Dictionary with cache health information
     """
-    total_size = get_cache_size()
-    files = get_cache_files()
+    # One scandir pass supplies sizes and file keys; no per-file dicts or
+    # ISO timestamp strings are built
+    total_size = 0
+    total_files = 0
 
     # Count valid vs stale vs corrupted
     valid_count = 0
     stale_count = 0
     corrupted_count = 0
 
-    for file_info in files:
-        cache_path = CACHE_DIR / file_info["name"]
+    for entry in _scan_cache_files():
+        try:
+            stat = entry.stat()
+        except IOError:
+            continue
+
+        total_files += 1
+        total_size += stat.st_size
         # Determine cache type from filename
-        cache_type = file_info["name"].split("_")[0]
+        cache_type = entry.name.split("_")[0]
+        file_key = (entry.path, stat.st_mtime_ns, stat.st_size)
 
-        if is_cache_valid(cache_path, cache_type):
+        try:
+            data = _parse_cache_file(*file_key)
+        except (json.JSONDecodeError, IOError):
+            corrupted_count += 1
+            continue
+
+        # Parse and checksum results are memoized per file version, so
+        # repeated health checks of unchanged files only stat them
+        is_valid, is_stale, _ = _validate_parsed(
+            Path(entry.path), data, _verify_cache_file(*file_key), cache_type
+        )
+        if is_valid:
             valid_count += 1
-        elif is_cache_stale_but_usable(cache_path, cache_type):
+        elif is_stale:
             stale_count += 1
         else:
             corrupted_count += 1
 
     return {
-        "total_files": len(files),
+        "total_files": total_files,
         "total_size_bytes": total_size,
         "total_size_mb": round(total_size / (1024 * 1024), 2),
         "valid_count": valid_count,
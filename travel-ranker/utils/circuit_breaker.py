@@ -5,13 +5,15 @@ Provides fault tolerance for external API calls with automatic
 recovery after failure thresholds are exceeded.
 """
 
+import inspect
 import time
+from collections import deque
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime
 from enum import Enum
 from functools import wraps
 from threading import Lock
-from typing import Any, Callable, Dict, Optional, TypeVar
+from typing import Any, Callable, Deque, Dict, Optional, TypeVar
 
 try:
     import pybreaker
@@ -19,6 +21,9 @@ try:
 except ImportError:
     PYBREAKER_AVAILABLE = False
 
+# Internal timekeeping clock: cheap float reads, immune to wall-clock jumps
+_now = time.monotonic
+
 
 # ============================================================================
 # Circuit Breaker States
@@ -69,20 +74,34 @@ DEFAULT_CONFIGS = {
 # Circuit Breaker Implementation
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class CircuitBreakerStats:
-    """Statistics for circuit breaker monitoring."""
+    """Statistics for circuit breaker monitoring (slotted: no per-instance __dict__)."""
 
     failures: int = 0
     successes: int = 0
     consecutive_failures: int = 0
     consecutive_successes: int = 0
-    last_failure_time: Optional[datetime] = None
-    last_success_time: Optional[datetime] = None
+    last_failure_ts: Optional[float] = None   # time.time() of last failure
+    last_success_ts: Optional[float] = None   # time.time() of last success
     state_changes: int = 0
     total_requests: int = 0
     blocked_requests: int = 0
 
+    @property
+    def last_failure_time(self) -> Optional[datetime]:
+        """Time of the last failure, built only when read."""
+        if self.last_failure_ts is None:
+            return None
+        return datetime.fromtimestamp(self.last_failure_ts)
+
+    @property
+    def last_success_time(self) -> Optional[datetime]:
+        """Time of the last success, built only when read."""
+        if self.last_success_ts is None:
+            return None
+        return datetime.fromtimestamp(self.last_success_ts)
+
 
 class SimpleCircuitBreaker:
     """
@@ -108,19 +127,28 @@ class SimpleCircuitBreaker:
         """
         self.name = name
         self.config = config or DEFAULT_CONFIGS.get(name, DEFAULT_CONFIGS["default"])
+        # isinstance/except need a real tuple; normalize once here
+        self._excluded_exceptions = tuple(self.config.excluded_exceptions)
+
+        # Hot-path thresholds, copied off the config once (config is fixed
+        # for the breaker's lifetime)
+        self._timeout_s = float(self.config.timeout_seconds)
+        self._rate_window_s = float(self.config.rate_limit_window)
+        self._rate_threshold = int(self.config.rate_limit_threshold)
+        self._failure_threshold = int(self.config.failure_threshold)
+        self._success_threshold = int(self.config.success_threshold)
         self._state = CircuitState.CLOSED
         self._stats = CircuitBreakerStats()
-        self._last_state_change = datetime.now()
+        self._last_state_change_ts = _now()
         self._lock = Lock()
 
-        # Rate limiting
-        self._request_times: list = []
+        # Rate limiting: admission times, oldest first
+        self._request_times: Deque[float] = deque()
 
     @property
     def state(self) -> CircuitState:
-        """Get current circuit state."""
-        with self._lock:
-            return self._state
+        """Get current circuit state (a single attribute read, so no lock)."""
+        return self._state
 
     @property
     def stats(self) -> CircuitBreakerStats:
@@ -130,68 +158,84 @@ class SimpleCircuitBreaker:
     @property
     def is_closed(self) -> bool:
         """Check if circuit is closed (normal operation)."""
-        return self.state == CircuitState.CLOSED
+        return self.state is CircuitState.CLOSED
 
     @property
     def is_open(self) -> bool:
         """Check if circuit is open (blocking requests)."""
-        return self.state == CircuitState.OPEN
+        return self.state is CircuitState.OPEN
 
-    def _should_attempt_reset(self) -> bool:
+    def _should_attempt_reset(self, now: Optional[float] = None) -> bool:
         """Check if enough time has passed to attempt recovery."""
-        if self._state != CircuitState.OPEN:
+        if self._state is not CircuitState.OPEN:
             return False
 
-        timeout = timedelta(seconds=self.config.timeout_seconds)
-        return datetime.now() - self._last_state_change >= timeout
+        if now is None:
+            now = _now()
+        return now - self._last_state_change_ts >= self._timeout_s
 
-    def _transition_to(self, new_state: CircuitState) -> None:
+    def _transition_to(self, new_state: CircuitState, now: Optional[float] = None) -> None:
         """Transition to a new state."""
-        if self._state != new_state:
+        if self._state is not new_state:
             self._state = new_state
-            self._last_state_change = datetime.now()
+            self._last_state_change_ts = _now() if now is None else now
             self._stats.state_changes += 1
 
-    def _check_rate_limit(self) -> bool:
+    def _check_rate_limit(self, now: Optional[float] = None) -> bool:
         """Check if request is within rate limit."""
-        now = time.time()
-        window_start = now - self.config.rate_limit_window
+        if now is None:
+            now = _now()
+        window_start = now - self._rate_window_s
 
-        # Clean old requests
-        self._request_times = [t for t in self._request_times if t > window_start]
+        # Drop expired requests from the old end; times are appended in order
+        request_times = self._request_times
+        while request_times and request_times[0] <= window_start:
+            request_times.popleft()
 
-        return len(self._request_times) < self.config.rate_limit_threshold
+        return len(request_times) < self._rate_threshold
 
     def record_success(self) -> None:
         """Record a successful request."""
+        if self._state is not CircuitState.HALF_OPEN:
+            # Fast path: a success outside HALF_OPEN never changes state, so
+            # only monitoring counters move and the lock is skipped. As with
+            # blocked_requests, a lost increment under contention is acceptable.
+            stats = self._stats
+            stats.successes += 1
+            stats.total_requests += 1
+            stats.consecutive_successes += 1
+            stats.consecutive_failures = 0
+            stats.last_success_ts = time.time()
+            return
+
         with self._lock:
             self._stats.successes += 1
             self._stats.total_requests += 1
             self._stats.consecutive_successes += 1
             self._stats.consecutive_failures = 0
-            self._stats.last_success_time = datetime.now()
+            self._stats.last_success_ts = time.time()
 
-            if self._state == CircuitState.HALF_OPEN:
-                if self._stats.consecutive_successes >= self.config.success_threshold:
+            if self._state is CircuitState.HALF_OPEN:
+                if self._stats.consecutive_successes >= self._success_threshold:
                     self._transition_to(CircuitState.CLOSED)
 
     def record_failure(self, exception: Optional[Exception] = None) -> None:
         """Record a failed request."""
-        with self._lock:
-            # Check if exception is excluded
-            if exception and isinstance(exception, self.config.excluded_exceptions):
-                return
+        # Excluded exceptions never touch the lock
+        if exception is not None and isinstance(exception, self._excluded_exceptions):
+            return
 
+        with self._lock:
             self._stats.failures += 1
             self._stats.total_requests += 1
             self._stats.consecutive_failures += 1
             self._stats.consecutive_successes = 0
-            self._stats.last_failure_time = datetime.now()
+            self._stats.last_failure_ts = time.time()
 
-            if self._state == CircuitState.CLOSED:
-                if self._stats.consecutive_failures >= self.config.failure_threshold:
+            if self._state is CircuitState.CLOSED:
+                if self._stats.consecutive_failures >= self._failure_threshold:
                     self._transition_to(CircuitState.OPEN)
-            elif self._state == CircuitState.HALF_OPEN:
+            elif self._state is CircuitState.HALF_OPEN:
                 self._transition_to(CircuitState.OPEN)
 
     def can_execute(self) -> bool:
@@ -201,46 +245,64 @@ class SimpleCircuitBreaker:
         Returns:
             True if request should proceed, False if blocked
         """
+        # One clock read per admission decision, shared by every check below
+        now = _now()
+
+        # Fast path: while open and still inside the timeout, reject without
+        # taking the lock. blocked_requests is a monitoring counter, so an
+        # occasional lost increment under contention is acceptable.
+        if self._state is CircuitState.OPEN and not self._should_attempt_reset(now):
+            self._stats.blocked_requests += 1
+            return False
+
         with self._lock:
             # Check rate limit first
-            if not self._check_rate_limit():
+            if not self._check_rate_limit(now):
                 return False
 
-            if self._state == CircuitState.CLOSED:
-                self._request_times.append(time.time())
+            if self._state is CircuitState.CLOSED:
+                self._request_times.append(now)
                 return True
 
-            if self._state == CircuitState.OPEN:
-                if self._should_attempt_reset():
-                    self._transition_to(CircuitState.HALF_OPEN)
+            if self._state is CircuitState.OPEN:
+                if self._should_attempt_reset(now):
+                    self._transition_to(CircuitState.HALF_OPEN, now)
                     self._stats.consecutive_successes = 0
-                    self._request_times.append(time.time())
+                    self._request_times.append(now)
                     return True
                 self._stats.blocked_requests += 1
                 return False
 
-            if self._state == CircuitState.HALF_OPEN:
-                self._request_times.append(time.time())
+            if self._state is CircuitState.HALF_OPEN:
+                self._request_times.append(now)
                 return True
 
             return False
 
     def __call__(self, func: Callable) -> Callable:
         """Decorator to wrap function with circuit breaker."""
+        # Bind once so each wrapped call reads closure cells instead of
+        # re-resolving attributes and creating bound methods
+        can_execute = self.can_execute
+        record_success = self.record_success
+        record_failure = self.record_failure
+        excluded_exceptions = self._excluded_exceptions
+        name = self.name
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            if not self.can_execute():
+            if not can_execute():
                 raise CircuitBreakerOpenError(
-                    f"Circuit breaker '{self.name}' is OPEN"
+                    f"Circuit breaker '{name}' is OPEN"
                 )
             try:
                 result = func(*args, **kwargs)
-                self.record_success()
+                record_success()
                 return result
-            except self.config.excluded_exceptions:
+            except excluded_exceptions:
                 raise
             except Exception as e:
-                self.record_failure(e)
+                record_failure(e)
                 raise
         return wrapper
 
@@ -249,29 +311,27 @@ class SimpleCircuitBreaker:
         with self._lock:
             self._state = CircuitState.CLOSED
             self._stats = CircuitBreakerStats()
-            self._last_state_change = datetime.now()
-            self._request_times = []
+            self._last_state_change_ts = _now()
+            self._request_times.clear()
 
     def get_status(self) -> Dict[str, Any]:
         """Get current status for monitoring."""
+        # One attribute walk into stats; each timestamp is formatted once
+        stats = self._stats
+        last_failure = stats.last_failure_time
+        last_success = stats.last_success_time
         return {
             "name": self.name,
             "state": self._state.value,
             "stats": {
-                "failures": self._stats.failures,
-                "successes": self._stats.successes,
-                "consecutive_failures": self._stats.consecutive_failures,
-                "total_requests": self._stats.total_requests,
-                "blocked_requests": self._stats.blocked_requests,
+                "failures": stats.failures,
+                "successes": stats.successes,
+                "consecutive_failures": stats.consecutive_failures,
+                "total_requests": stats.total_requests,
+                "blocked_requests": stats.blocked_requests,
             },
-            "last_failure": (
-                self._stats.last_failure_time.isoformat()
-                if self._stats.last_failure_time else None
-            ),
-            "last_success": (
-                self._stats.last_success_time.isoformat()
-                if self._stats.last_success_time else None
-            ),
+            "last_failure": last_failure.isoformat() if last_failure else None,
+            "last_success": last_success.isoformat() if last_success else None,
         }
 
 
@@ -310,11 +370,20 @@ class CircuitBreakerRegistry:
         Returns:
             Circuit breaker instance
         """
+        # Fast path: breakers are never removed, so once created a plain
+        # dict read is enough and the lock is only taken on first use.
+        breaker = self._breakers.get(name)
+        if breaker is not None:
+            return breaker
+
         with self._lock:
-            if name not in self._breakers:
+            # Re-check: another thread may have created it while we waited
+            breaker = self._breakers.get(name)
+            if breaker is None:
                 breaker_config = config or DEFAULT_CONFIGS.get(name, DEFAULT_CONFIGS["default"])
-                self._breakers[name] = SimpleCircuitBreaker(name, breaker_config)
-            return self._breakers[name]
+                breaker = SimpleCircuitBreaker(name, breaker_config)
+                self._breakers[name] = breaker
+            return breaker
 
     def get_all_status(self) -> Dict[str, Dict[str, Any]]:
         """Get status of all circuit breakers."""
@@ -348,6 +417,10 @@ def get_circuit_breaker(name: str) -> SimpleCircuitBreaker:
     return circuit_breakers.get(name)
 
 
+# Function attribute holding {breaker name: wrapper} for with_circuit_breaker
+_WRAPPER_CACHE_ATTR = "_circuit_breaker_wrappers"
+
+
 def with_circuit_breaker(name: str):
     """
     Decorator factory for applying circuit breaker to a function.
@@ -357,10 +430,37 @@ def with_circuit_breaker(name: str):
 
     Returns:
         Decorator function
+
+    Re-applying the decorator to the same plain function returns the wrapper
+    built the first time, so dynamic per-call decoration does not rebuild it.
+    Bound methods are wrapped fresh each time.
     """
     def decorator(func: Callable) -> Callable:
-        breaker = get_circuit_breaker(name)
-        return breaker(func)
+        # Bound methods forward attribute reads to __func__, so a cache on
+        # them would be shared by every instance (and the class function)
+        if inspect.ismethod(func):
+            return get_circuit_breaker(name)(func)
+
+        # Wrappers live on the function itself rather than in a global map:
+        # a wrapper references its function, so a global cache keyed on the
+        # function (even weakly) would keep it alive forever. Only the
+        # function's own __dict__ is consulted.
+        try:
+            own_attrs = vars(func)
+        except TypeError:
+            own_attrs = None  # Builtins etc. can't carry attributes
+        wrappers = own_attrs.get(_WRAPPER_CACHE_ATTR) if own_attrs is not None else None
+        if wrappers is not None and name in wrappers:
+            return wrappers[name]
+
+        wrapper = get_circuit_breaker(name)(func)
+        # @wraps copies func.__dict__; the wrapper must not share func's cache
+        wrapper.__dict__.pop(_WRAPPER_CACHE_ATTR, None)
+        if own_attrs is not None:
+            if wrappers is None:
+                wrappers = own_attrs[_WRAPPER_CACHE_ATTR] = {}
+            wrappers[name] = wrapper
+        return wrapper
     return decorator
 
 
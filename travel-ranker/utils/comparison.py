@@ -8,9 +8,32 @@ Provides tools for:
 """
 
 from typing import Dict, Any, List, Optional, Tuple
+import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
 
+# Score component keys, in radar axis order
+_RADAR_BASE_KEYS = ('exchange', 'flight', 'col')
+_RADAR_EXPANDED_KEYS = ('safety', 'visa', 'access')
+
+# Bar chart traffic-light colors: good, middling, poor
+_BAR_COLORS = ('#4CAF50', '#FFC107', '#F44336')
+_HIGHER_IS_BETTER_METRICS = frozenset({'Score', 'Safety', 'Visa Ease', 'Quality'})
+
+# Comparison table rows: (label, destination key, better, unit)
+_TABLE_METRICS = (
+    ("Overall Score", "Score", "higher", None),
+    ("Flight Cost", "Flight Cost (TWD)", "lower", "TWD"),
+    ("Monthly CoL", "Monthly CoL (USD)", "lower", "USD"),
+    ("Data Quality", "Quality", "higher", "%"),
+)
+# Expanded rows read from score_data components: (label, component, better)
+_TABLE_EXPANDED_METRICS = (
+    ("Safety Index", "safety", "higher"),
+    ("Visa Ease", "visa", "higher"),
+    ("Travel Access", "access", "higher"),
+)
+
 
 def normalize_score(value: float, min_val: float, max_val: float) -> float:
     """Normalize a value to 0-100 scale."""
@@ -36,8 +59,11 @@ def create_comparison_radar_chart(
     if not destinations:
         return None
 
+    # Decide once for the whole chart so every trace has the same axes
+    use_expanded = include_expanded and _has_expanded_data(destinations[0])
+
     # Define categories based on whether we have expanded data
-    if include_expanded and _has_expanded_data(destinations[0]):
+    if use_expanded:
         categories = [
             'Exchange Rate',
             'Flight Cost',
@@ -52,6 +78,10 @@ def create_comparison_radar_chart(
             'Flight Cost',
             'Cost of Living'
         ]
+    component_keys = _RADAR_BASE_KEYS + (_RADAR_EXPANDED_KEYS if use_expanded else ())
+
+    # Close the radar chart
+    categories_closed = categories + [categories[0]]
 
     fig = go.Figure()
 
@@ -59,26 +89,11 @@ def create_comparison_radar_chart(
     colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728']
 
     for i, dest in enumerate(destinations):
-        score_data = dest.get('score_data', {})
-        components = score_data.get('components', {})
+        components = dest.get('score_data', {}).get('components', {})
 
         # Build values for each category
-        values = [
-            components.get('exchange', {}).get('score', 50),
-            components.get('flight', {}).get('score', 50),
-            components.get('col', {}).get('score', 50),
-        ]
-
-        if include_expanded and _has_expanded_data(dest):
-            values.extend([
-                components.get('safety', {}).get('score', 50),
-                components.get('visa', {}).get('score', 50),
-                components.get('access', {}).get('score', 50),
-            ])
-
-        # Close the radar chart
+        values = [components.get(key, {}).get('score', 50) for key in component_keys]
         values.append(values[0])
-        categories_closed = categories + [categories[0]]
 
         fig.add_trace(go.Scatterpolar(
             r=values,
@@ -140,14 +155,15 @@ def create_comparison_bar_chart(
     countries = [d.get('Country', f'Dest {i}') for i, d in enumerate(destinations)]
     values = [d.get(metric, 0) for d in destinations]
 
-    # Color based on value (green = better)
-    if metric in ['Score', 'Safety', 'Visa Ease', 'Quality']:
-        # Higher is better
-        colors = ['#4CAF50' if v >= 70 else '#FFC107' if v >= 50 else '#F44336' for v in values]
+    # Color based on value (green = better); np.select picks the first match
+    vals = np.asarray(values, dtype=np.float64)
+    if metric in _HIGHER_IS_BETTER_METRICS:
+        conditions = [vals >= 70, vals >= 50]
     else:
         # Lower is better (costs)
-        max_val = max(values) if values else 1
-        colors = ['#4CAF50' if v <= max_val * 0.4 else '#FFC107' if v <= max_val * 0.7 else '#F44336' for v in values]
+        max_val = vals.max()
+        conditions = [vals <= max_val * 0.4, vals <= max_val * 0.7]
+    colors = np.select(conditions, _BAR_COLORS[:2], default=_BAR_COLORS[2]).tolist()
 
     fig = go.Figure(data=[
         go.Bar(
@@ -194,15 +210,20 @@ def calculate_comparison_summary(
     col_costs = [d.get('Monthly CoL (USD)', 0) for d in destinations]
     countries = [d.get('Country', '') for d in destinations]
 
-    # Find best/worst for each metric
-    best_score_idx = scores.index(max(scores))
-    best_flight_idx = flight_costs.index(min(flight_costs))
-    best_col_idx = col_costs.index(min(col_costs))
+    # One (N, 3) matrix so best/worst per metric is a single C-level scan.
+    # argmax/argmin return the first extreme, matching list.index(max(...)).
+    metrics = np.array([scores, flight_costs, col_costs], dtype=np.float64).T
+    max_idx = metrics.argmax(axis=0)
+    min_idx = metrics.argmin(axis=0)
 
-    # Calculate differences
-    score_diff = max(scores) - min(scores)
-    flight_diff = max(flight_costs) - min(flight_costs)
-    col_diff = max(col_costs) - min(col_costs)
+    best_score_idx = int(max_idx[0])
+    best_flight_idx = int(min_idx[1])
+    best_col_idx = int(min_idx[2])
+
+    # Calculate differences from the original values to keep their types
+    score_diff = scores[best_score_idx] - scores[int(min_idx[0])]
+    flight_diff = flight_costs[int(max_idx[1])] - flight_costs[best_flight_idx]
+    col_diff = col_costs[int(max_idx[2])] - col_costs[best_col_idx]
 
     summary = {
         "best_overall": {
@@ -271,74 +292,35 @@ def get_comparison_table_data(
     if not destinations:
         return []
 
-    rows = []
-    metrics = [
-        ("Overall Score", "Score", "higher", None),
-        ("Flight Cost", "Flight Cost (TWD)", "lower", "TWD"),
-        ("Monthly CoL", "Monthly CoL (USD)", "lower", "USD"),
-        ("Data Quality", "Quality", "higher", "%"),
+    labels = [d.get('Country', f'Dest {i}') for i, d in enumerate(destinations)]
+
+    # (metric_name, better, unit, values) per row, values in destination order
+    specs = [
+        (metric_name, better, unit, [d.get(key, 0) for d in destinations])
+        for metric_name, key, better, unit in _TABLE_METRICS
     ]
 
-    # Add expanded metrics if available
+    # Add safety, visa, access from score_data when available, skipping
+    # indicators no destination has data for
     if _has_expanded_data(destinations[0]):
-        # Get values from score_data components
-        for metric_name, key, better, unit in metrics:
-            row = {"Metric": metric_name, "Better": better, "Unit": unit}
-            values = []
-
-            for i, dest in enumerate(destinations):
-                value = dest.get(key, 0)
-                row[dest.get('Country', f'Dest {i}')] = value
-                values.append(value)
-
-            # Mark best value
-            if better == "higher":
-                best_idx = values.index(max(values))
-            else:
-                best_idx = values.index(min(values))
-
-            row["best_country"] = destinations[best_idx].get('Country', '')
-            rows.append(row)
-
-        # Add safety, visa, access from score_data
-        expanded_metrics = [
-            ("Safety Index", "safety", "higher"),
-            ("Visa Ease", "visa", "higher"),
-            ("Travel Access", "access", "higher"),
-        ]
+        components = [d.get('score_data', {}).get('components', {}) for d in destinations]
+        for metric_name, comp_key, better in _TABLE_EXPANDED_METRICS:
+            values = [comp.get(comp_key, {}).get('value', 0) or 0 for comp in components]
+            if any(v > 0 for v in values):
+                specs.append((metric_name, better, "pts", values))
+
+    # Best destination for every metric in one argmax over an (M, N) matrix;
+    # lower-is-better rows are negated so argmax finds their minimum
+    matrix = np.array([values for _, _, _, values in specs], dtype=np.float64)
+    signs = np.array([1.0 if better == "higher" else -1.0 for _, better, _, _ in specs])
+    best_indices = (matrix * signs[:, None]).argmax(axis=1).tolist()
 
-        for metric_name, comp_key, better in expanded_metrics:
-            row = {"Metric": metric_name, "Better": better, "Unit": "pts"}
-            values = []
-
-            for i, dest in enumerate(destinations):
-                score_data = dest.get('score_data', {})
-                comp = score_data.get('components', {}).get(comp_key, {})
-                value = comp.get('value', 0) or 0
-                row[dest.get('Country', f'Dest {i}')] = value
-                values.append(value)
-
-            if values and any(v > 0 for v in values):
-                best_idx = values.index(max(values))
-                row["best_country"] = destinations[best_idx].get('Country', '')
-                rows.append(row)
-    else:
-        for metric_name, key, better, unit in metrics:
-            row = {"Metric": metric_name, "Better": better, "Unit": unit}
-            values = []
-
-            for i, dest in enumerate(destinations):
-                value = dest.get(key, 0)
-                row[dest.get('Country', f'Dest {i}')] = value
-                values.append(value)
-
-            if better == "higher":
-                best_idx = values.index(max(values))
-            else:
-                best_idx = values.index(min(values))
-
-            row["best_country"] = destinations[best_idx].get('Country', '')
-            rows.append(row)
+    rows = []
+    for (metric_name, better, unit, values), best_idx in zip(specs, best_indices):
+        row = {"Metric": metric_name, "Better": better, "Unit": unit}
+        row.update(zip(labels, values))
+        row["best_country"] = destinations[best_idx].get('Country', '')
+        rows.append(row)
 
     return rows
 
@@ -350,6 +332,19 @@ def _has_expanded_data(destination: Dict[str, Any]) -> bool:
     return 'safety' in components or 'visa' in components or 'access' in components
 
 
+# Badge comparison HTML fragments, filled positionally per destination/badge
+_BADGE_CARD_OPEN_FMT = (
+    '<div style="flex: 1; min-width: 200px; padding: 1rem; background: #f8f9fa; border-radius: 8px;">'
+    '<h4 style="margin: 0 0 0.5rem 0; color: #333;">{}</h4>'
+    '<div style="display: flex; flex-wrap: wrap; gap: 0.25rem;">'
+)
+_BADGE_FMT = (
+    '<span style="background: {}; color: {}; padding: 2px 8px; border-radius: 4px; '
+    'font-size: 0.75rem; font-weight: 500;">{}</span>'
+)
+_NO_BADGES_HTML = '<span style="color: #666; font-size: 0.85rem;">No badges</span>'
+
+
 def render_comparison_badges_html(destinations: List[Dict[str, Any]]) -> str:
     """
     Render HTML showing unique badges for each destination.
@@ -366,30 +361,15 @@ def render_comparison_badges_html(destinations: List[Dict[str, Any]]) -> str:
     html_parts = ['<div style="display: flex; flex-wrap: wrap; gap: 1rem;">']
 
     for dest in destinations:
-        country = dest.get('Country', 'Unknown')
-        badges = dest.get('badges_list', [])
-
-        html_parts.append(f'''
-        <div style="flex: 1; min-width: 200px; padding: 1rem; background: #f8f9fa; border-radius: 8px;">
-            <h4 style="margin: 0 0 0.5rem 0; color: #333;">{country}</h4>
-            <div style="display: flex; flex-wrap: wrap; gap: 0.25rem;">
-        ''')
+        html_parts.append(_BADGE_CARD_OPEN_FMT.format(dest.get('Country', 'Unknown')))
 
+        badges = dest.get('badges_list', [])
         if badges:
             for badge in badges:
-                badge_color = _get_badge_color(badge)
-                html_parts.append(f'''
-                    <span style="
-                        background: {badge_color['bg']};
-                        color: {badge_color['text']};
-                        padding: 2px 8px;
-                        border-radius: 4px;
-                        font-size: 0.75rem;
-                        font-weight: 500;
-                    ">{badge}</span>
-                ''')
+                bg, text = _get_badge_color(badge)
+                html_parts.append(_BADGE_FMT.format(bg, text, badge))
         else:
-            html_parts.append('<span style="color: #666; font-size: 0.85rem;">No badges</span>')
+            html_parts.append(_NO_BADGES_HTML)
 
         html_parts.append('</div></div>')
 
@@ -398,17 +378,21 @@ def render_comparison_badges_html(destinations: List[Dict[str, Any]]) -> str:
     return ''.join(html_parts)
 
 
-def _get_badge_color(badge: str) -> Dict[str, str]:
-    """Get color scheme for a badge."""
-    badge_colors = {
-        "EXCELLENT": {"bg": "#E8F5E9", "text": "#2E7D32"},
-        "HOT DEAL": {"bg": "#FFEBEE", "text": "#C62828"},
-        "CURRENCY WIN": {"bg": "#E3F2FD", "text": "#1565C0"},
-        "FLIGHT DEAL": {"bg": "#FFF3E0", "text": "#E65100"},
-        "DEFLATION": {"bg": "#F3E5F5", "text": "#7B1FA2"},
-        "SAFE HAVEN": {"bg": "#E0F7FA", "text": "#00695C"},
-        "EASY ENTRY": {"bg": "#FFF8E1", "text": "#FF6F00"},
-        "NOMAD VISA": {"bg": "#FCE4EC", "text": "#AD1457"},
-        "WELL CONNECTED": {"bg": "#E8EAF6", "text": "#283593"},
-    }
-    return badge_colors.get(badge, {"bg": "#ECEFF1", "text": "#455A64"})
+# Badge name -> (background, text) colors
+_BADGE_COLORS: Dict[str, Tuple[str, str]] = {
+    "EXCELLENT": ("#E8F5E9", "#2E7D32"),
+    "HOT DEAL": ("#FFEBEE", "#C62828"),
+    "CURRENCY WIN": ("#E3F2FD", "#1565C0"),
+    "FLIGHT DEAL": ("#FFF3E0", "#E65100"),
+    "DEFLATION": ("#F3E5F5", "#7B1FA2"),
+    "SAFE HAVEN": ("#E0F7FA", "#00695C"),
+    "EASY ENTRY": ("#FFF8E1", "#FF6F00"),
+    "NOMAD VISA": ("#FCE4EC", "#AD1457"),
+    "WELL CONNECTED": ("#E8EAF6", "#283593"),
+}
+_DEFAULT_BADGE_COLOR = ("#ECEFF1", "#455A64")
+
+
+def _get_badge_color(badge: str) -> Tuple[str, str]:
+    """Get (background, text) colors for a badge."""
+    return _BADGE_COLORS.get(badge, _DEFAULT_BADGE_COLOR)
@@ -7,10 +7,28 @@ Provides tools for:
 - Managing data provenance metadata
 """
 
+import time
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Dict, List, Literal, Optional
+from functools import cache, lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+@cache
+def _numpy():
+    """
+    Import numpy on first use of an array helper.
+
+    cache.py and api_clients.py import this module, so a top-level numpy
+    import would load it for every cache or API client import.
+    """
+    import numpy
+    return numpy
 
 
 # ============================================================================
@@ -36,11 +54,58 @@ SOURCE_QUALITY_SCORES = {
 }
 
 
+# DestinationDataQuality components: (output name, attribute), in output order
+_COMPONENT_FIELDS = (
+    ("exchange", "exchange_data"),
+    ("flight", "flight_data"),
+    ("col", "col_data"),
+    ("safety", "safety_data"),
+    ("visa", "visa_data"),
+    ("access", "access_data"),
+)
+# Components always present in to_dict() output, even when missing (None)
+_CORE_COMPONENTS = frozenset({"exchange", "flight", "col"})
+
+# Enum value strings, looked up by member on serialization paths
+_SOURCE_VALUES = {source: source.value for source in DataSource}
+
+# Sources whose data can count as fresh (see DataWithProvenance.is_fresh)
+_FRESH_CAPABLE_SOURCES = (DataSource.LIVE_API, DataSource.CACHE)
+
+# Sources from lowest to highest quality, for picking a destination's
+# primary (worst) source
+_SOURCE_ORDER = (
+    DataSource.MOCK,
+    DataSource.BASELINE,
+    DataSource.STALE_CACHE,
+    DataSource.CACHE,
+    DataSource.LIVE_API,
+)
+
 # ============================================================================
 # Data Provenance Types
 # ============================================================================
 
-@dataclass
+# Freshness buckets: upper age bounds (1 hour, 24 hours, 1 week) and the
+# level/color for each bucket, indexed by bisect_right over the bounds
+_FRESHNESS_BOUNDARIES = (3600.0, 86400.0, 604800.0)
+_FRESHNESS_LEVELS = ("fresh", "recent", "stale", "very_stale")
+_FRESHNESS_COLORS = (
+    "#4CAF50",  # Green
+    "#8BC34A",  # Light green
+    "#FFC107",  # Yellow
+    "#F44336",  # Red
+)
+
+
+def _freshness_level_from_age(
+    age_seconds: float
+) -> Literal["fresh", "recent", "stale", "very_stale"]:
+    """Map a data age in seconds to its freshness level category."""
+    return _FRESHNESS_LEVELS[bisect_right(_FRESHNESS_BOUNDARIES, age_seconds)]
+
+
+@dataclass(slots=True)
 class DataWithProvenance:
     """
     Container for data with provenance tracking.
@@ -57,58 +122,70 @@ class DataWithProvenance:
     raw_response: Optional[Dict[str, Any]] = None
     validation_warnings: List[str] = field(default_factory=list)
 
+    # fetched_at as a POSIX timestamp, memoized against the datetime it was
+    # computed from so reassigning fetched_at is picked up (see fetched_epoch)
+    _fetched_epoch: float = field(default=0.0, init=False, repr=False, compare=False)
+    _epoch_of: Optional[datetime] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def fetched_epoch(self) -> float:
+        """fetched_at as a POSIX timestamp, so age checks are float subtraction."""
+        fetched_at = self.fetched_at
+        # datetimes are immutable, so an identity check detects reassignment
+        if fetched_at is not self._epoch_of:
+            self._fetched_epoch = fetched_at.timestamp()
+            self._epoch_of = fetched_at
+        return self._fetched_epoch
+
+    def age_seconds(self, now: Optional[float] = None) -> float:
+        """
+        Get the age of the data in seconds.
+
+        Args:
+            now: Reference time.time() value; pass one shared value when
+                checking many items so the clock is read once per batch
+
+        Returns:
+            Seconds elapsed since fetched_at
+        """
+        if now is None:
+            now = time.time()
+        return now - self.fetched_epoch
+
     @property
     def is_fresh(self) -> bool:
         """Check if data is considered fresh (< 1 hour old)."""
-        if self.source in (DataSource.LIVE_API, DataSource.CACHE):
-            age = (datetime.now() - self.fetched_at).total_seconds()
-            return age < 3600  # 1 hour
+        if self.source in _FRESH_CAPABLE_SOURCES:
+            return self.age_seconds() < 3600  # 1 hour
         return False
 
     @property
     def is_stale(self) -> bool:
         """Check if data is stale (> 24 hours old)."""
-        if self.source == DataSource.STALE_CACHE:
+        if self.source is DataSource.STALE_CACHE:
             return True
-        age = (datetime.now() - self.fetched_at).total_seconds()
-        return age > 86400  # 24 hours
+        return self.age_seconds() > 86400  # 24 hours
 
     @property
     def freshness_level(self) -> Literal["fresh", "recent", "stale", "very_stale"]:
         """Get freshness level category."""
-        age_hours = (datetime.now() - self.fetched_at).total_seconds() / 3600
-
-        if age_hours < 1:
-            return "fresh"
-        elif age_hours < 24:
-            return "recent"
-        elif age_hours < 168:  # 1 week
-            return "stale"
-        else:
-            return "very_stale"
+        return _freshness_level_from_age(self.age_seconds())
 
     @property
     def freshness_color(self) -> str:
         """Get color indicator for UI display."""
-        level = self.freshness_level
-        colors = {
-            "fresh": "#4CAF50",      # Green
-            "recent": "#8BC34A",     # Light green
-            "stale": "#FFC107",      # Yellow
-            "very_stale": "#F44336", # Red
-        }
-        return colors.get(level, "#9E9E9E")
+        return _FRESHNESS_COLORS[bisect_right(_FRESHNESS_BOUNDARIES, self.age_seconds())]
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, now: Optional[float] = None) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
             "value": self.value,
-            "source": self.source.value,
+            "source": _SOURCE_VALUES[self.source],
             "fetched_at": self.fetched_at.isoformat(),
             "cache_age_seconds": self.cache_age_seconds,
             "quality_score": self.quality_score,
             "field_name": self.field_name,
-            "freshness_level": self.freshness_level,
+            "freshness_level": _freshness_level_from_age(self.age_seconds(now)),
             "validation_warnings": self.validation_warnings,
         }
 
@@ -117,13 +194,14 @@ class DataWithProvenance:
         cls,
         value: Any,
         field_name: str = "",
-        quality_score: float = 100.0
+        quality_score: float = 100.0,
+        fetched_at: Optional[datetime] = None
     ) -> "DataWithProvenance":
         """Create from fresh API data."""
         return cls(
             value=value,
             source=DataSource.LIVE_API,
-            fetched_at=datetime.now(),
+            fetched_at=fetched_at or datetime.now(),
             quality_score=quality_score,
             field_name=field_name,
         )
@@ -142,8 +220,11 @@ class DataWithProvenance:
 
         # Reduce quality based on age
         base_score = SOURCE_QUALITY_SCORES[source]
-        age_penalty = min(age_seconds / 3600, 20)  # Up to 20 point penalty
-        quality_score = max(base_score - age_penalty, 20)
+        # Inline clamps (same tie behavior as min/max, without the builtin calls)
+        age_penalty = age_seconds / 3600
+        age_penalty = age_penalty if age_penalty <= 20 else 20  # Up to 20 point penalty
+        quality_score = base_score - age_penalty
+        quality_score = quality_score if quality_score >= 20 else 20
 
         return cls(
             value=value,
@@ -186,7 +267,7 @@ class DataWithProvenance:
 # Data Quality Tracking
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class DestinationDataQuality:
     """
     Quality tracking for all data components of a destination.
@@ -208,7 +289,16 @@ class DestinationDataQuality:
 
     def __post_init__(self):
         """Calculate overall quality score."""
-        self._calculate_overall_quality()
+        # Callers often construct an empty instance, attach the *_data
+        # fields, then call _calculate_overall_quality() themselves. With no
+        # components the score is just 0.0, so skip the full pass.
+        if (
+            self.exchange_data or self.flight_data or self.col_data or
+            self.safety_data or self.visa_data or self.access_data
+        ):
+            self._calculate_overall_quality()
+        else:
+            self.overall_quality_score = 0.0
 
     def _calculate_overall_quality(self) -> None:
         """Calculate weighted overall quality score.
@@ -223,57 +313,49 @@ class DestinationDataQuality:
 
         Falls back to legacy weights (30/20/50) if new indicators not present.
         """
-        scores = []
-        weights = []
-
         # Check if we have expanded indicator data
-        has_expanded = (
-            self.safety_data is not None or
-            self.visa_data is not None or
-            self.access_data is not None
-        )
+        has_expanded = self.has_expanded_data
+
+        # Weighted mean over present components: accumulate score * weight
+        # and the weight total, normalizing once at the end
+        weighted_sum = 0.0
+        total_weight = 0.0
 
         if has_expanded:
             # Use new weights
             if self.exchange_data:
-                scores.append(self.exchange_data.quality_score)
-                weights.append(0.20)
+                weighted_sum += self.exchange_data.quality_score * 0.20
+                total_weight += 0.20
             if self.flight_data:
-                scores.append(self.flight_data.quality_score)
-                weights.append(0.15)
+                weighted_sum += self.flight_data.quality_score * 0.15
+                total_weight += 0.15
             if self.col_data:
-                scores.append(self.col_data.quality_score)
-                weights.append(0.35)
+                weighted_sum += self.col_data.quality_score * 0.35
+                total_weight += 0.35
             if self.safety_data:
-                scores.append(self.safety_data.quality_score)
-                weights.append(0.15)
+                weighted_sum += self.safety_data.quality_score * 0.15
+                total_weight += 0.15
             if self.visa_data:
-                scores.append(self.visa_data.quality_score)
-                weights.append(0.10)
+                weighted_sum += self.visa_data.quality_score * 0.10
+                total_weight += 0.10
             if self.access_data:
-                scores.append(self.access_data.quality_score)
-                weights.append(0.05)
+                weighted_sum += self.access_data.quality_score * 0.05
+                total_weight += 0.05
         else:
             # Legacy weights
             if self.exchange_data:
-                scores.append(self.exchange_data.quality_score)
-                weights.append(0.30)
+                weighted_sum += self.exchange_data.quality_score * 0.30
+                total_weight += 0.30
             if self.flight_data:
-                scores.append(self.flight_data.quality_score)
-                weights.append(0.20)
+                weighted_sum += self.flight_data.quality_score * 0.20
+                total_weight += 0.20
             if self.col_data:
-                scores.append(self.col_data.quality_score)
-                weights.append(0.50)
-
-        if scores and weights:
-            # Normalize weights
-            total_weight = sum(weights)
-            normalized_weights = [w / total_weight for w in weights]
-            self.overall_quality_score = sum(
-                s * w for s, w in zip(scores, normalized_weights)
-            )
-        else:
-            self.overall_quality_score = 0.0
+                weighted_sum += self.col_data.quality_score * 0.50
+                total_weight += 0.50
+
+        self.overall_quality_score = (
+            weighted_sum / total_weight if total_weight else 0.0
+        )
 
     @property
     def quality_level(self) -> Literal["excellent", "good", "fair", "poor"]:
@@ -287,40 +369,26 @@ class DestinationDataQuality:
         else:
             return "poor"
 
-    @property
-    def primary_source(self) -> DataSource:
-        """Get the primary data source (lowest quality source)."""
-        sources = []
-        if self.exchange_data:
-            sources.append(self.exchange_data.source)
-        if self.flight_data:
-            sources.append(self.flight_data.source)
-        if self.col_data:
-            sources.append(self.col_data.source)
-        if self.safety_data:
-            sources.append(self.safety_data.source)
-        if self.visa_data:
-            sources.append(self.visa_data.source)
-        if self.access_data:
-            sources.append(self.access_data.source)
-
-        if not sources:
-            return DataSource.MOCK
-
-        # Return the "worst" source (lowest in enum order represents lower quality)
-        source_order = [
-            DataSource.MOCK,
-            DataSource.BASELINE,
-            DataSource.STALE_CACHE,
-            DataSource.CACHE,
-            DataSource.LIVE_API,
-        ]
-        for source in source_order:
+    def _compute_primary_source(self) -> DataSource:
+        """Find the lowest-quality source across all components."""
+        sources = set()
+        for _, attr in _COMPONENT_FIELDS:
+            data = getattr(self, attr)
+            if data:
+                sources.add(data.source)
+
+        # Return the "worst" source present
+        for source in _SOURCE_ORDER:
             if source in sources:
                 return source
 
         return DataSource.MOCK
 
+    @property
+    def primary_source(self) -> DataSource:
+        """Get the primary data source (lowest quality source)."""
+        return self._compute_primary_source()
+
     @property
     def has_expanded_data(self) -> bool:
         """Check if expanded indicator data is available."""
@@ -330,49 +398,55 @@ class DestinationDataQuality:
             self.access_data is not None
         )
 
-    def get_freshness_summary(self) -> Dict[str, str]:
-        """Get freshness levels for all components."""
+    def get_freshness_summary(self, now: Optional[float] = None) -> Dict[str, str]:
+        """
+        Get freshness levels for all components.
+
+        Args:
+            now: Reference time.time() value shared by every component;
+                read once here when omitted
+
+        Returns:
+            Mapping of component name to freshness level
+        """
+        if now is None:
+            now = time.time()
+
         summary = {}
-        if self.exchange_data:
-            summary["exchange"] = self.exchange_data.freshness_level
-        if self.flight_data:
-            summary["flight"] = self.flight_data.freshness_level
-        if self.col_data:
-            summary["col"] = self.col_data.freshness_level
-        if self.safety_data:
-            summary["safety"] = self.safety_data.freshness_level
-        if self.visa_data:
-            summary["visa"] = self.visa_data.freshness_level
-        if self.access_data:
-            summary["access"] = self.access_data.freshness_level
+        for name, attr in _COMPONENT_FIELDS:
+            data = getattr(self, attr)
+            if data:
+                summary[name] = _freshness_level_from_age(data.age_seconds(now))
         return summary
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, now: Optional[float] = None) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
-        components = {
-            "exchange": self.exchange_data.to_dict() if self.exchange_data else None,
-            "flight": self.flight_data.to_dict() if self.flight_data else None,
-            "col": self.col_data.to_dict() if self.col_data else None,
-        }
-
-        # Add expanded components if present
-        if self.safety_data:
-            components["safety"] = self.safety_data.to_dict()
-        if self.visa_data:
-            components["visa"] = self.visa_data.to_dict()
-        if self.access_data:
-            components["access"] = self.access_data.to_dict()
+        if now is None:
+            now = time.time()
+
+        # One pass builds both the component dicts and the freshness summary;
+        # core components are always listed, expanded ones only if present
+        components: Dict[str, Optional[Dict[str, Any]]] = {}
+        freshness: Dict[str, str] = {}
+        for name, attr in _COMPONENT_FIELDS:
+            data = getattr(self, attr)
+            if data:
+                component = data.to_dict(now)
+                components[name] = component
+                freshness[name] = component["freshness_level"]
+            elif name in _CORE_COMPONENTS:
+                components[name] = None
 
         return {
             "country_key": self.country_key,
             "country_name": self.country_name,
             "overall_quality_score": round(self.overall_quality_score, 1),
             "quality_level": self.quality_level,
-            "primary_source": self.primary_source.value,
+            "primary_source": _SOURCE_VALUES[self.primary_source],
             "calculated_at": self.calculated_at.isoformat(),
             "has_expanded_data": self.has_expanded_data,
             "components": components,
-            "freshness": self.get_freshness_summary(),
+            "freshness": freshness,
         }
 
 
@@ -418,8 +492,10 @@ def calculate_source_quality(
     if source in (DataSource.CACHE, DataSource.STALE_CACHE):
         # Penalty increases with age
         # 0 hours -> 0 penalty, 24 hours -> 10 penalty, 168 hours -> 30 penalty
-        age_penalty = min(age_hours / 24 * 10, 30)
-        return max(base_score - age_penalty, 10)
+        age_penalty = age_hours / 24 * 10
+        age_penalty = age_penalty if age_penalty <= 30 else 30
+        score = base_score - age_penalty
+        return score if score >= 10 else 10
 
     return base_score
 
@@ -445,27 +521,127 @@ def aggregate_quality_scores(
             "freshness_distribution": {},
         }
 
-    scores = [q.overall_quality_score for q in qualities]
+    return aggregate_quality_scores_soa(to_soa(qualities))
+
+
+# ============================================================================
+# Batch Quality Arrays
+# ============================================================================
+
+# Small-int codes for DataSource in the array layout (-1 = no component)
+_SOURCES_BY_CODE = tuple(DataSource)
+_SOURCE_CODES = {source: code for code, source in enumerate(_SOURCES_BY_CODE)}
+_NO_SOURCE = -1
+
+
+@dataclass(slots=True)
+class DestinationQualityArrays:
+    """
+    Column-oriented (structure-of-arrays) view of many destinations' quality.
+
+    Row i is destination i; component columns follow _COMPONENT_FIELDS
+    (exchange, flight, col, safety, visa, access). Missing components have
+    presence False, score 0, source code -1 and epoch NaN.
+    """
+
+    overall_scores: "np.ndarray"   # float64[N]
+    primary_sources: "np.ndarray"  # int8[N], codes into _SOURCES_BY_CODE
+    quality_scores: "np.ndarray"   # float64[N, 6]
+    presence_mask: "np.ndarray"    # bool[N, 6]
+    sources: "np.ndarray"          # int8[N, 6]
+    fetched_epoch: "np.ndarray"    # float64[N, 6], POSIX timestamps
+
+    def __len__(self) -> int:
+        return len(self.overall_scores)
+
+
+def to_soa(qualities: List[DestinationDataQuality]) -> DestinationQualityArrays:
+    """
+    Convert destination quality objects to the array layout in one pass.
+
+    Args:
+        qualities: List of destination quality objects
+
+    Returns:
+        DestinationQualityArrays with one row per destination
+    """
+    np = _numpy()
+    n_rows = len(qualities)
+    n_fields = len(_COMPONENT_FIELDS)
+
+    overall_scores = np.empty(n_rows, dtype=np.float64)
+    primary_sources = np.empty(n_rows, dtype=np.int8)
+    quality_scores = np.zeros((n_rows, n_fields), dtype=np.float64)
+    presence_mask = np.zeros((n_rows, n_fields), dtype=bool)
+    sources = np.full((n_rows, n_fields), _NO_SOURCE, dtype=np.int8)
+    fetched_epoch = np.full((n_rows, n_fields), np.nan, dtype=np.float64)
+
+    for i, q in enumerate(qualities):
+        overall_scores[i] = q.overall_quality_score
+        primary_sources[i] = _SOURCE_CODES[q.primary_source]
+        for j, (_, attr) in enumerate(_COMPONENT_FIELDS):
+            data = getattr(q, attr)
+            if data:
+                quality_scores[i, j] = data.quality_score
+                presence_mask[i, j] = True
+                sources[i, j] = _SOURCE_CODES[data.source]
+                fetched_epoch[i, j] = data.fetched_epoch
+
+    return DestinationQualityArrays(
+        overall_scores=overall_scores,
+        primary_sources=primary_sources,
+        quality_scores=quality_scores,
+        presence_mask=presence_mask,
+        sources=sources,
+        fetched_epoch=fetched_epoch,
+    )
+
+
+def aggregate_quality_scores_soa(
+    arrays: DestinationQualityArrays,
+    now: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    Aggregate quality statistics from the array layout.
+
+    Args:
+        arrays: Non-empty DestinationQualityArrays
+        now: Reference time.time() value for freshness; read once if omitted
+
+    Returns:
+        Aggregated statistics, same schema as aggregate_quality_scores
+    """
+    np = _numpy()
+    if now is None:
+        now = time.time()
+
+    scores = arrays.overall_scores
 
-    # Count sources
-    source_counts: Dict[str, int] = {}
-    for q in qualities:
-        source = q.primary_source.value
-        source_counts[source] = source_counts.get(source, 0) + 1
+    # Count primary sources by code
+    source_counts = np.bincount(arrays.primary_sources, minlength=len(_SOURCES_BY_CODE))
 
-    # Count freshness levels
-    freshness_counts: Dict[str, int] = {}
-    for q in qualities:
-        for level in q.get_freshness_summary().values():
-            freshness_counts[level] = freshness_counts.get(level, 0) + 1
+    # Bucket every present component's age into a freshness level
+    ages = now - arrays.fetched_epoch[arrays.presence_mask]
+    level_counts = np.bincount(
+        np.searchsorted(_FRESHNESS_BOUNDARIES, ages, side="right"),
+        minlength=len(_FRESHNESS_LEVELS),
+    )
 
     return {
-        "average_quality": round(sum(scores) / len(scores), 1),
-        "min_quality": round(min(scores), 1),
-        "max_quality": round(max(scores), 1),
-        "source_distribution": source_counts,
-        "freshness_distribution": freshness_counts,
-        "total_destinations": len(qualities),
+        "average_quality": round(float(scores.mean()), 1),
+        "min_quality": round(float(scores.min()), 1),
+        "max_quality": round(float(scores.max()), 1),
+        "source_distribution": {
+            _SOURCE_VALUES[_SOURCES_BY_CODE[code]]: int(count)
+            for code, count in enumerate(source_counts.tolist())
+            if count
+        },
+        "freshness_distribution": {
+            _FRESHNESS_LEVELS[idx]: int(count)
+            for idx, count in enumerate(level_counts.tolist())
+            if count
+        },
+        "total_destinations": len(arrays),
     }
 
 
@@ -473,7 +649,7 @@ def aggregate_quality_scores(
 # Provenance Metadata
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ProvenanceMetadata:
     """
     Metadata for tracking data provenance in database records.
@@ -493,12 +669,13 @@ class ProvenanceMetadata:
 
     def to_db_columns(self) -> Dict[str, Any]:
         """Convert to dictionary for database insertion."""
+        data_source = _SOURCE_VALUES[self.data_source]
         result = {
-            "data_source": self.data_source.value,
+            "data_source": data_source,
             "data_quality_score": round(self.data_quality_score, 1),
-            "exchange_source": self.exchange_source or self.data_source.value,
-            "flight_source": self.flight_source or self.data_source.value,
-            "col_source": self.col_source or self.data_source.value,
+            "exchange_source": self.exchange_source or data_source,
+            "flight_source": self.flight_source or data_source,
+            "col_source": self.col_source or data_source,
         }
 
         # Add expanded sources if present
@@ -521,27 +698,27 @@ class ProvenanceMetadata:
             data_source=quality.primary_source,
             data_quality_score=quality.overall_quality_score,
             exchange_source=(
-                quality.exchange_data.source.value
+                _SOURCE_VALUES[quality.exchange_data.source]
                 if quality.exchange_data else None
             ),
             flight_source=(
-                quality.flight_data.source.value
+                _SOURCE_VALUES[quality.flight_data.source]
                 if quality.flight_data else None
             ),
             col_source=(
-                quality.col_data.source.value
+                _SOURCE_VALUES[quality.col_data.source]
                 if quality.col_data else None
             ),
             safety_source=(
-                quality.safety_data.source.value
+                _SOURCE_VALUES[quality.safety_data.source]
                 if quality.safety_data else None
             ),
             visa_source=(
-                quality.visa_data.source.value
+                _SOURCE_VALUES[quality.visa_data.source]
                 if quality.visa_data else None
             ),
             access_source=(
-                quality.access_data.source.value
+                _SOURCE_VALUES[quality.access_data.source]
                 if quality.access_data else None
             ),
         )
@@ -551,6 +728,57 @@ class ProvenanceMetadata:
 # UI Display Helpers
 # ============================================================================
 
+# Quality badge tiers, lowest first, indexed by bisect_right over the lower
+# bounds of the upper three tiers: (background, text color, label)
+_QUALITY_TIER_BOUNDS = (40, 60, 80)
+_QUALITY_BADGE_TIERS = (
+    ("#FFEBEE", "#C62828", "Low Quality"),
+    ("#FFF3E0", "#E65100", "Fair Quality"),
+    ("#E3F2FD", "#1565C0", "Good Quality"),
+    ("#E8F5E9", "#2E7D32", "High Quality"),
+)
+# Everything up to the score is fixed per tier, so it is rendered once here
+_QUALITY_BADGE_PREFIXES = tuple(
+    f'<span style="background-color: {bg}; color: {text}; padding: 2px 8px; '
+    f'border-radius: 4px; font-size: 0.75rem; font-weight: 500;">{label} ('
+    for bg, text, label in _QUALITY_BADGE_TIERS
+)
+_QUALITY_BADGE_SUFFIX = "%)</span>"
+
+# Freshness indicators: level -> (dot, color, label)
+_FRESHNESS_INDICATORS = {
+    "fresh": ("●", "#4CAF50", "Fresh"),
+    "recent": ("●", "#8BC34A", "Recent"),
+    "stale": ("●", "#FFC107", "Stale"),
+    "very_stale": ("●", "#F44336", "Very Stale"),
+}
+_UNKNOWN_FRESHNESS_INDICATOR = ("●", "#9E9E9E", "Unknown")
+
+
+def _render_freshness_indicator(dot: str, color: str, label: str) -> str:
+    """Render the freshness indicator markup for one level."""
+    return (
+        f'<span style="color: {color}; font-weight: 600;" title="{label}">{dot}</span> '
+        f'<span style="font-size: 0.75rem; color: #666;">{label}</span>'
+    )
+
+
+# The indicator depends only on the level, so every variant is prebuilt
+_FRESHNESS_INDICATOR_HTML = {
+    level: _render_freshness_indicator(*indicator)
+    for level, indicator in _FRESHNESS_INDICATORS.items()
+}
+_UNKNOWN_FRESHNESS_INDICATOR_HTML = _render_freshness_indicator(
+    *_UNKNOWN_FRESHNESS_INDICATOR
+)
+
+
+@lru_cache(maxsize=512)
+def _quality_badge_html(tier: int, rounded_score: int) -> str:
+    """Badge markup for one (tier, displayed integer score) pair."""
+    return "".join((_QUALITY_BADGE_PREFIXES[tier], str(rounded_score), _QUALITY_BADGE_SUFFIX))
+
+
 def get_quality_badge_html(quality_score: float) -> str:
     """
     Generate HTML badge for quality score display.
@@ -561,33 +789,13 @@ def get_quality_badge_html(quality_score: float) -> str:
     Returns:
         HTML string for quality badge
     """
-    if quality_score >= 80:
-        bg_color = "#E8F5E9"
-        text_color = "#2E7D32"
-        label = "High Quality"
-    elif quality_score >= 60:
-        bg_color = "#E3F2FD"
-        text_color = "#1565C0"
-        label = "Good Quality"
-    elif quality_score >= 40:
-        bg_color = "#FFF3E0"
-        text_color = "#E65100"
-        label = "Fair Quality"
-    else:
-        bg_color = "#FFEBEE"
-        text_color = "#C62828"
-        label = "Low Quality"
-
-    return f'''
-        <span style="
-            background-color: {bg_color};
-            color: {text_color};
-            padding: 2px 8px;
-            border-radius: 4px;
-            font-size: 0.75rem;
-            font-weight: 500;
-        ">{label} ({quality_score:.0f}%)</span>
-    '''
+    tier = bisect_right(_QUALITY_TIER_BOUNDS, quality_score)
+    if quality_score != quality_score:
+        # NaN cannot be rounded to a cache key
+        return "".join((_QUALITY_BADGE_PREFIXES[tier], "nan", _QUALITY_BADGE_SUFFIX))
+    # Real scores are nearly unique floats, so the cache is keyed on what
+    # the badge shows: the tier and the score rounded as :.0f would
+    return _quality_badge_html(tier, round(quality_score))
 
 
 def get_freshness_indicator_html(freshness_level: str) -> str:
@@ -600,21 +808,19 @@ def get_freshness_indicator_html(freshness_level: str) -> str:
     Returns:
         HTML string for freshness indicator
     """
-    indicators = {
-        "fresh": ("●", "#4CAF50", "Fresh"),
-        "recent": ("●", "#8BC34A", "Recent"),
-        "stale": ("●", "#FFC107", "Stale"),
-        "very_stale": ("●", "#F44336", "Very Stale"),
-    }
-
-    dot, color, label = indicators.get(freshness_level, ("●", "#9E9E9E", "Unknown"))
-
-    return f'''
-        <span style="color: {color}; font-weight: 600;" title="{label}">
-            {dot}
-        </span>
-        <span style="font-size: 0.75rem; color: #666;">{label}</span>
-    '''
+    return _FRESHNESS_INDICATOR_HTML.get(
+        freshness_level, _UNKNOWN_FRESHNESS_INDICATOR_HTML
+    )
+
+
+# Human-readable data source labels
+_SOURCE_LABELS = {
+    DataSource.LIVE_API: "Live API",
+    DataSource.CACHE: "Cached",
+    DataSource.STALE_CACHE: "Stale Cache",
+    DataSource.BASELINE: "Baseline",
+    DataSource.MOCK: "Demo Data",
+}
 
 
 def get_source_label(source: DataSource) -> str:
@@ -627,11 +833,4 @@ def get_source_label(source: DataSource) -> str:
     Returns:
         Human-readable label
     """
-    labels = {
-        DataSource.LIVE_API: "Live API",
-        DataSource.CACHE: "Cached",
-        DataSource.STALE_CACHE: "Stale Cache",
-        DataSource.BASELINE: "Baseline",
-        DataSource.MOCK: "Demo Data",
-    }
-    return labels.get(source, "Unknown")
+    return _SOURCE_LABELS.get(source, "Unknown")
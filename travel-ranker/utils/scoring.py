@@ -17,6 +17,9 @@ Scoring weights (v2 - expanded indicators):
 - Travel accessibility: 5%
 """
 
+import math
+from dataclasses import dataclass
+from operator import mul
 from typing import Dict, Any, List, Tuple, Optional
 
 from utils.validators import (
@@ -34,6 +37,24 @@ from utils.logging_config import get_logger
 # Logger
 logger = get_logger("scoring")
 
+
+@dataclass(frozen=True, slots=True)
+class ScoringWeights:
+    """Immutable per-indicator weight set for one scoring version."""
+
+    exchange: float
+    flight: float
+    col: float
+    safety: float = 0.0
+    visa: float = 0.0
+    access: float = 0.0
+
+    @property
+    def vector(self) -> Tuple[float, ...]:
+        """Weights in indicator order: exchange, flight, col, safety, visa, access."""
+        return (self.exchange, self.flight, self.col, self.safety, self.visa, self.access)
+
+
 # Scoring weights (v2 - expanded indicators)
 EXCHANGE_WEIGHT = 0.20
 FLIGHT_WEIGHT = 0.15
@@ -47,6 +68,25 @@ LEGACY_FLIGHT_WEIGHT = 0.20
 LEGACY_EXCHANGE_WEIGHT = 0.30
 LEGACY_COL_WEIGHT = 0.50
 
+EXPANDED_WEIGHTS = ScoringWeights(
+    exchange=EXCHANGE_WEIGHT,
+    flight=FLIGHT_WEIGHT,
+    col=COL_WEIGHT,
+    safety=SAFETY_WEIGHT,
+    visa=VISA_WEIGHT,
+    access=ACCESS_WEIGHT,
+)
+LEGACY_WEIGHTS = ScoringWeights(
+    exchange=LEGACY_EXCHANGE_WEIGHT,
+    flight=LEGACY_FLIGHT_WEIGHT,
+    col=LEGACY_COL_WEIGHT,
+)
+
+# Weight vectors specialized per scoring version, built once at import
+_EXPANDED_VECTOR = EXPANDED_WEIGHTS.vector
+_EXPANDED_CORE_VECTOR = _EXPANDED_VECTOR[:3]
+_LEGACY_VECTOR = LEGACY_WEIGHTS.vector[:3]
+
 # Badge thresholds
 BADGE_EXCELLENT_THRESHOLD = 85
 BADGE_HOT_DEAL_THRESHOLD = 15  # overall change %
@@ -73,8 +113,52 @@ BADGE_STYLES = {
 
 
 def clip(value: float, min_val: float, max_val: float) -> float:
-    """Clip value to range [min_val, max_val]."""
-    return max(min_val, min(max_val, value))
+    """Clip value to range [min_val, max_val]; NaN clips to max_val."""
+    # Chained conditional avoids two builtin calls on the scoring hot path.
+    # NaN fails both comparisons, so it is mapped to max_val explicitly, as
+    # max(min_val, min(max_val, nan)) did, rather than leaking into fsum.
+    if value != value:
+        return max_val
+    return min_val if value < min_val else max_val if value > max_val else value
+
+
+def _weighted_sum(values: Tuple[float, ...], weights: Tuple[float, ...]) -> float:
+    """Exactly-rounded dot product of values and weights (extra weights are ignored)."""
+    return math.fsum(map(mul, values, weights))
+
+
+def _make_component(
+    score: float,
+    change: float,
+    current: float,
+    baseline: float,
+    weight: float,
+    confidence: float
+) -> Dict[str, Any]:
+    """Build a momentum component entry (exchange, flight, col) for the breakdown."""
+    return {
+        "score": round(score, 1),
+        "change": round(change, 1),
+        "current": current,
+        "baseline": baseline,
+        "weight": weight,
+        "confidence": round(confidence, 2)
+    }
+
+
+def _make_indicator_component(
+    score: float,
+    value: float,
+    weight: float,
+    confidence: float
+) -> Dict[str, Any]:
+    """Build a static indicator entry (safety, visa, access) for the breakdown."""
+    return {
+        "score": round(score, 1),
+        "value": value,
+        "weight": weight,
+        "confidence": round(confidence, 2)
+    }
 
 
 def calculate_exchange_score(
@@ -317,6 +401,64 @@ def calculate_access_score(access_score: float) -> Tuple[float, float]:
     return score, confidence
 
 
+def _score_legacy(
+    core_scores: Tuple[float, float, float],
+    core_confs: Tuple[float, float, float]
+) -> Tuple[float, float, None]:
+    """
+    Blend the three core components with the legacy weights.
+
+    Returns:
+        Tuple of (raw_score, overall_confidence, None)
+    """
+    return (
+        _weighted_sum(core_scores, _LEGACY_VECTOR),
+        _weighted_sum(core_confs, _LEGACY_VECTOR),
+        None,
+    )
+
+
+def _score_expanded(
+    core_scores: Tuple[float, float, float],
+    core_confs: Tuple[float, float, float],
+    safety_index: float,
+    visa_score: float,
+    access_score: float
+) -> Tuple[float, float, Dict[str, Dict[str, Any]]]:
+    """
+    Score the three new indicators and blend them with the core components.
+
+    Returns:
+        Tuple of (raw_score, overall_confidence, indicator_components)
+    """
+    safety_score_val, safety_conf = calculate_safety_score(safety_index)
+    visa_score_val, visa_conf = calculate_visa_score(visa_score)
+    access_score_val, access_conf = calculate_access_score(access_score)
+
+    raw_score = _weighted_sum(
+        core_scores + (safety_score_val, visa_score_val, access_score_val),
+        _EXPANDED_VECTOR
+    )
+    overall_confidence = _weighted_sum(
+        core_confs + (safety_conf, visa_conf, access_conf),
+        _EXPANDED_VECTOR
+    )
+
+    indicator_components = {
+        "safety": _make_indicator_component(
+            safety_score_val, safety_index, SAFETY_WEIGHT, safety_conf
+        ),
+        "visa": _make_indicator_component(
+            visa_score_val, visa_score, VISA_WEIGHT, visa_conf
+        ),
+        "access": _make_indicator_component(
+            access_score_val, access_score, ACCESS_WEIGHT, access_conf
+        ),
+    }
+
+    return raw_score, overall_confidence, indicator_components
+
+
 def calculate_destination_score(
     current_exchange_rate: float,
     baseline_exchange_rate: float,
@@ -364,7 +506,12 @@ def calculate_destination_score(
         current_col, baseline_col, country=country
     )
 
-    # Calculate new indicator scores if available and expanded scoring is enabled
+    core_scores = (exchange_score, flight_score, col_score)
+    core_confs = (exchange_conf, flight_conf, col_conf)
+
+    # Expanded scoring needs all three new indicators, otherwise fall back
+    # to legacy. Explicit identity checks: `in` would fall back to __eq__,
+    # which raises on values such as pd.NA.
     has_expanded_data = (
         use_expanded_scoring and
         safety_index is not None and
@@ -373,51 +520,17 @@ def calculate_destination_score(
     )
 
     if has_expanded_data:
-        # Calculate new indicator scores
-        safety_score_val, safety_conf = calculate_safety_score(safety_index)
-        visa_score_val, visa_conf = calculate_visa_score(visa_score)
-        access_score_val, access_conf = calculate_access_score(access_score)
-
-        # Calculate final weighted score with all 6 indicators
-        raw_score = (
-            exchange_score * EXCHANGE_WEIGHT +
-            flight_score * FLIGHT_WEIGHT +
-            col_score * COL_WEIGHT +
-            safety_score_val * SAFETY_WEIGHT +
-            visa_score_val * VISA_WEIGHT +
-            access_score_val * ACCESS_WEIGHT
-        )
-
-        # Calculate confidence from all component confidences
-        overall_confidence = (
-            exchange_conf * EXCHANGE_WEIGHT +
-            flight_conf * FLIGHT_WEIGHT +
-            col_conf * COL_WEIGHT +
-            safety_conf * SAFETY_WEIGHT +
-            visa_conf * VISA_WEIGHT +
-            access_conf * ACCESS_WEIGHT
+        exchange_weight, flight_weight, col_weight = _EXPANDED_CORE_VECTOR
+        raw_score, overall_confidence, indicator_components = _score_expanded(
+            core_scores, core_confs, safety_index, visa_score, access_score
         )
     else:
         # Use legacy 3-indicator scoring
-        raw_score = (
-            exchange_score * LEGACY_EXCHANGE_WEIGHT +
-            flight_score * LEGACY_FLIGHT_WEIGHT +
-            col_score * LEGACY_COL_WEIGHT
-        )
-
-        overall_confidence = (
-            exchange_conf * LEGACY_EXCHANGE_WEIGHT +
-            flight_conf * LEGACY_FLIGHT_WEIGHT +
-            col_conf * LEGACY_COL_WEIGHT
+        exchange_weight, flight_weight, col_weight = _LEGACY_VECTOR
+        raw_score, overall_confidence, indicator_components = _score_legacy(
+            core_scores, core_confs
         )
 
-        safety_score_val = None
-        safety_conf = None
-        visa_score_val = None
-        visa_conf = None
-        access_score_val = None
-        access_conf = None
-
     # Apply data quality multiplier if available
     if data_quality:
         quality_multiplier = calculate_confidence_multiplier(
@@ -441,53 +554,30 @@ def calculate_destination_score(
         "confidence": round(overall_confidence, 2),
         "scoring_version": "expanded" if has_expanded_data else "legacy",
         "components": {
-            "exchange": {
-                "score": round(exchange_score, 1),
-                "change": round(exchange_change, 1),
-                "current": current_exchange_rate,
-                "baseline": baseline_exchange_rate,
-                "weight": EXCHANGE_WEIGHT if has_expanded_data else LEGACY_EXCHANGE_WEIGHT,
-                "confidence": round(exchange_conf, 2)
-            },
-            "flight": {
-                "score": round(flight_score, 1),
-                "change": round(flight_change, 1),
-                "current": current_flight_cost,
-                "baseline": baseline_flight_cost,
-                "weight": FLIGHT_WEIGHT if has_expanded_data else LEGACY_FLIGHT_WEIGHT,
-                "confidence": round(flight_conf, 2)
-            },
-            "col": {
-                "score": round(col_score, 1),
-                "change": round(col_change, 1),
-                "current": current_col,
-                "baseline": baseline_col,
-                "weight": COL_WEIGHT if has_expanded_data else LEGACY_COL_WEIGHT,
-                "confidence": round(col_conf, 2)
-            }
+            "exchange": _make_component(
+                exchange_score, exchange_change,
+                current_exchange_rate, baseline_exchange_rate,
+                exchange_weight,
+                exchange_conf
+            ),
+            "flight": _make_component(
+                flight_score, flight_change,
+                current_flight_cost, baseline_flight_cost,
+                flight_weight,
+                flight_conf
+            ),
+            "col": _make_component(
+                col_score, col_change,
+                current_col, baseline_col,
+                col_weight,
+                col_conf
+            )
         }
     }
 
     # Add expanded indicator components if available
-    if has_expanded_data:
-        result["components"]["safety"] = {
-            "score": round(safety_score_val, 1),
-            "value": safety_index,
-            "weight": SAFETY_WEIGHT,
-            "confidence": round(safety_conf, 2)
-        }
-        result["components"]["visa"] = {
-            "score": round(visa_score_val, 1),
-            "value": visa_score,
-            "weight": VISA_WEIGHT,
-            "confidence": round(visa_conf, 2)
-        }
-        result["components"]["access"] = {
-            "score": round(access_score_val, 1),
-            "value": access_score,
-            "weight": ACCESS_WEIGHT,
-            "confidence": round(access_conf, 2)
-        }
+    if indicator_components:
+        result["components"].update(indicator_components)
 
     return result
 